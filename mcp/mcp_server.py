@@ -5563,7 +5563,9 @@ async def process_adaptive_validation_feedback(
             user_cultural_profile=user_cultural_profile or {},
             enable_user_adaptation=enable_user_adaptation,
             enable_cultural_intelligence=enable_cultural_intelligence,
-            enable_cross_conversation_analysis=enable_cross_conversation_analysis
+            enable_cross_conversation_analysis=enable_cross_conversation_analysis,
+            enable_explanation=True,
+            enable_recommendations=True
         )
         
         # Process through adaptive validation orchestrator
@@ -5587,7 +5589,7 @@ async def process_adaptive_validation_feedback(
             # Insights and explanations
             'blending_weights': result.blending_weights,
             'component_contributions': result.component_contributions,
-            'adaptation_explanation': result.adaptation_explanation,
+            'adaptation_explanation': result.full_explanation,
             'recommendations': result.recommendations,
             
             # Performance metrics
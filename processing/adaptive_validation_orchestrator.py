@@ -8,14 +8,31 @@ Orchestrates user communication learning, cultural intelligence, and cross-conve
 while maintaining backward compatibility with existing LiveValidationLearner.
 """
 
+import sys
 import time
 import logging
-from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, fields, asdict
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Optional, Any, Tuple
 import json
 import numpy as np
 from datetime import datetime
 
+# Numba is optional - the weight kernel runs as plain NumPy without it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# orjson is optional - to_json falls back to stdlib json serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import adaptive learning components
 from processing.user_communication_learner import UserCommunicationStyleLearner, UserCommunicationProfile
 from processing.cultural_intelligence_engine import CulturalIntelligenceEngine, CulturalIntelligenceContext
@@ -25,12 +42,137 @@ from processing.cross_conversation_analyzer import CrossConversationAnalyzer, Us
 from database.vector_database import ClaudeVectorDatabase
 from database.enhanced_context import LiveValidationLearner
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging (handlers and levels are left to the application)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Blending order of the adaptive components (index into the weight/confidence arrays)
+_COMPONENT_ORDER = ('base', 'user', 'cultural', 'behavioral')
+
+
+def _blend_weights(base_weights: np.ndarray, confidences: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Confidence-adjusted, normalized blending weights (equal weights over mask if all zero)"""
+    # Higher confidence gets higher weight (0.5 to 2.0 multiplier)
+    adjusted = base_weights * (0.5 + confidences * 1.5) * mask
+    total = adjusted.sum()
+    if total > 0:
+        return adjusted / total
+    return mask / mask.sum()
+
+
+if njit is not None:
+    _blend_weights = njit(cache=True, fastmath=True)(_blend_weights)
+
+# Sentiment labels mapped to validation strength, and the empty default for missing component results
+_POS_LABELS = frozenset({'POSITIVE', 'positive'})
+_NEG_LABELS = frozenset({'NEGATIVE', 'negative'})
+_NO_RESULT: Dict[str, Any] = {}
+
+# Canned explanations for the blending fast paths
+_FALLBACK_EXPLANATION = "Adaptive validation unavailable - using fallback"
+_BASE_ONLY_EXPLANATION = "Adaptive blending: Existing system: %.2f (weight: 100.0%%)"
+
+# Per-component explanation lines: (component, template, (template field, result key, default) extras)
+_EXPLANATION_TEMPLATES = (
+    ('base', "Existing system: {strength:.2f} (weight: {weight:.1%})", ()),
+    ('user', "User adaptation: {strength:.2f} (weight: {weight:.1%}, profile: {profile:.2f})",
+     (('profile', 'user_profile_strength', 0),)),
+    ('cultural', "Cultural intelligence: {strength:.2f} (weight: {weight:.1%}, {language}, conf: {confidence:.2f})",
+     (('confidence', 'cultural_confidence', 0), ('language', 'language_detected', 'unknown'))),
+    ('behavioral', "Behavioral analysis: {strength:.2f} (weight: {weight:.1%}, conf: {confidence:.2f})",
+     (('confidence', 'behavioral_confidence', 0),))
+)
+
+# Recommendation texts in output order; bit i of the flags built in
+# AdaptiveValidationOrchestrator._generate_adaptive_recommendations selects entry i
+_RECOMMENDATION_TEXTS = (
+    "Low adaptation confidence - consider collecting more user feedback for learning",
+    "High adaptation confidence - user patterns well established",
+    "New user detected - initial feedback will improve future predictions",
+    "Strong user profile available - personalized predictions highly reliable",
+    "Cultural bias prevention applied - adjustments kept within ethical limits",
+    "Strong cultural adaptation applied - feedback interpreted with cultural context",
+    "Cross-conversation patterns detected - behavioral insights applied",
+    "Monitor follow-up behavior to validate feedback accuracy",
+    "High validation strength - solution likely very effective",
+    "Low validation strength - consider alternative approaches"
+)
+
+
+# Per-component recommendation rules: (bit, component, result key, threshold); a None
+# threshold means the key is a flag and only needs to be set
+_COMPONENT_RECOMMENDATION_RULES = (
+    (2, 'user', 'learning_opportunity', None),
+    (3, 'user', 'user_profile_strength', 0.7),
+    (4, 'cultural', 'bias_prevention_applied', None),
+    (5, 'cultural', 'cultural_confidence', 0.6)
+)
+
+
+@lru_cache(maxsize=256)
+def _recommendations_for(flags: int) -> Tuple[str, ...]:
+    """Recommendation texts selected by the flag bits, limited to top 5"""
+    return tuple(islice((text for i, text in enumerate(_RECOMMENDATION_TEXTS) if flags >> i & 1), 5))
 
 
-@dataclass
+# dataclass(slots=True) requires Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Per-component result handling: (result attribute, usage name, fallback fields on failure)
+_COMPONENT_SPECS = {
+    'base': ('base_validation', 'existing_system', {'validation_strength': 0.5}),
+    'user': ('user_adaptation', 'user_adaptation', {'user_adapted': False}),
+    'cultural': ('cultural_analysis', 'cultural_intelligence', {'cultural_confidence': 0.0}),
+    'behavioral': ('behavioral_analysis', 'cross_conversation', {'behavioral_analysis_available': False})
+}
+
+
+# Seconds a failed component is skipped before it is retried
+COMPONENT_RETRY_COOLDOWN = 5.0
+
+# Seconds a get_adaptive_learning_insights() report is reused for repeat polls
+INSIGHTS_CACHE_TTL = 2.0
+
+# Results recorded for components skipped while their circuit breaker is open
+_CIRCUIT_OPEN_RESULTS = {
+    name: {'error': 'skipped - component failed recently', 'circuit_open': True, **fallback}
+    for name, (_, _, fallback) in _COMPONENT_SPECS.items()
+}
+
+# Results recorded for components whose call from an earlier request is still running
+_STILL_RUNNING_RESULTS = {
+    name: {'error': 'skipped - previous call still running', 'still_running': True, **fallback}
+    for name, (_, _, fallback) in _COMPONENT_SPECS.items()
+}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class BlendingConfig:
+    """
+    Immutable blending configuration for the adaptive validation orchestrator.
+    
+    Use dataclasses.replace() to derive a modified configuration.
+    """
+    base_weight: float = 0.4  # Weight for existing system baseline
+    user_adaptation_weight: float = 0.25  # Weight for user-specific adaptation
+    cultural_intelligence_weight: float = 0.2  # Weight for cultural adjustments
+    behavioral_analysis_weight: float = 0.15  # Weight for cross-conversation insights
+    
+    # Confidence thresholds for component activation
+    min_user_confidence: float = 0.3
+    min_cultural_confidence: float = 0.4
+    min_behavioral_confidence: float = 0.3
+    
+    # Performance requirements
+    max_processing_time: float = 0.2  # 200ms hard limit
+    graceful_degradation: bool = True  # Fall back to existing system if components fail
+
+
+# Shared default configuration (immutable, so every orchestrator can use the same instance)
+DEFAULT_BLENDING_CONFIG = BlendingConfig()
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class AdaptiveValidationRequest:
     """
     Request structure for adaptive validation processing.
@@ -53,25 +195,22 @@ class AdaptiveValidationRequest:
     enable_cross_conversation_analysis: bool = True
     enable_existing_system: bool = True
     
+    # Optional outputs - only generated when the caller will read them
+    enable_explanation: bool = False
+    enable_recommendations: bool = False
+    
     # Performance requirements
     max_processing_time: float = 0.2  # 200ms requirement
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        return {
-            'feedback_text': self.feedback_text,
-            'solution_context': self.solution_context,
-            'user_id': self.user_id,
-            'user_cultural_profile': self.user_cultural_profile,
-            'enable_user_adaptation': self.enable_user_adaptation,
-            'enable_cultural_intelligence': self.enable_cultural_intelligence,
-            'enable_cross_conversation_analysis': self.enable_cross_conversation_analysis,
-            'enable_existing_system': self.enable_existing_system,
-            'max_processing_time': self.max_processing_time
-        }
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+
+AdaptiveValidationRequest._FIELDS = tuple(f.name for f in fields(AdaptiveValidationRequest))
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AdaptiveValidationResult:
     """
     Complete result from adaptive validation processing.
@@ -106,25 +245,37 @@ class AdaptiveValidationResult:
     improvement_over_baseline: float = 0.0
     confidence_increase: float = 0.0
     
+    # Critical failure details (set only on the fallback path)
+    error_type: Optional[str] = None
+    error_message: Optional[str] = None
+    
+    @property
+    def full_explanation(self) -> str:
+        """Explanation including the failure details, formatted on demand"""
+        if self.error_message is None:
+            return self.adaptation_explanation
+        return "%s: %s" % (self.adaptation_explanation, self.error_message)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        return {
-            'final_validation_strength': self.final_validation_strength,
-            'adaptation_confidence': self.adaptation_confidence,
-            'base_validation': self.base_validation,
-            'user_adaptation': self.user_adaptation,
-            'cultural_analysis': self.cultural_analysis,
-            'behavioral_analysis': self.behavioral_analysis,
-            'blending_weights': self.blending_weights,
-            'component_contributions': self.component_contributions,
-            'adaptation_explanation': self.adaptation_explanation,
-            'recommendations': self.recommendations,
-            'processing_time': self.processing_time,
-            'performance_compliant': self.performance_compliant,
-            'components_processed': self.components_processed,
-            'improvement_over_baseline': self.improvement_over_baseline,
-            'confidence_increase': self.confidence_increase
-        }
+        result = {name: getattr(self, name) for name in self._FIELDS}
+        if self.error_message is not None:
+            result['adaptation_explanation'] = self.full_explanation
+        return result
+    
+    def to_json(self) -> bytes:
+        """
+        Serialize to UTF-8 JSON bytes without building an intermediate dict.
+        
+        Prefer this over to_dict() when the caller only needs the encoded payload.
+        """
+        if orjson is not None:
+            payload = self if self.error_message is None else self.to_dict()
+            return orjson.dumps(payload, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(self.to_dict(), default=str).encode('utf-8')
+
+
+AdaptiveValidationResult._FIELDS = tuple(f.name for f in fields(AdaptiveValidationResult))
 
 
 class ProcessingStats:
@@ -140,10 +291,21 @@ class ProcessingStats:
             'cross_conversation': 0,
             'existing_system': 0
         }
-        self.average_processing_time = 0.0
-        self.average_improvement = 0.0
-        self.confidence_improvements = []
+        self.sum_processing_time = 0.0
+        self.sum_improvement = 0.0
+        self.confidence_improvements = deque(maxlen=100)  # Keep last 100
+        self._conf_sum = 0.0  # Running sum of confidence_improvements
         
+    @property
+    def average_processing_time(self) -> float:
+        """Mean processing time per request in seconds"""
+        return self.sum_processing_time / max(1, self.total_requests)
+    
+    @property
+    def average_improvement(self) -> float:
+        """Mean improvement over baseline per request"""
+        return self.sum_improvement / max(1, self.total_requests)
+    
     def record_processing(self, processing_time: float, components_used: List[str], 
                          improvement: float, confidence_increase: float):
         """Record processing statistics"""
@@ -159,20 +321,15 @@ class ProcessingStats:
             if component in self.component_usage:
                 self.component_usage[component] += 1
         
-        # Update averages
-        self.average_processing_time = (
-            (self.average_processing_time * (self.total_requests - 1) + processing_time) / 
-            self.total_requests
-        )
-        
-        self.average_improvement = (
-            (self.average_improvement * (self.total_requests - 1) + improvement) / 
-            self.total_requests
-        )
+        # Accumulate totals; averages are derived on read
+        self.sum_processing_time += processing_time
+        self.sum_improvement += improvement
         
+        # Keep the windowed sum in step with the deque's auto-eviction
+        if len(self.confidence_improvements) == self.confidence_improvements.maxlen:
+            self._conf_sum -= self.confidence_improvements[0]
+        self._conf_sum += confidence_increase
         self.confidence_improvements.append(confidence_increase)
-        if len(self.confidence_improvements) > 100:  # Keep last 100
-            self.confidence_improvements = self.confidence_improvements[-100:]
     
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Get comprehensive performance metrics"""
@@ -187,9 +344,7 @@ class ProcessingStats:
             'component_usage': self.component_usage,
             'average_processing_time': self.average_processing_time,
             'average_improvement': self.average_improvement,
-            'average_confidence_increase': (
-                np.mean(self.confidence_improvements) if self.confidence_improvements else 0.0
-            )
+            'average_confidence_increase': self._conf_sum / max(1, len(self.confidence_improvements))
         }
 
 
@@ -200,9 +355,25 @@ class AdaptiveValidationOrchestrator:
     Orchestrates user communication learning, cultural intelligence, 
     cross-conversation analysis, and existing validation systems to
     achieve 92% → 96% validation accuracy improvement.
+    
+    Reported processing_time values are monotonic durations measured with
+    time.perf_counter(), so SLA compliance is unaffected by wall-clock adjustments.
     """
     
-    def __init__(self):
+    # Constant portions of the system-wide insights report
+    _STATIC_SYSTEM_TARGETS = {
+        'accuracy_improvement_target': "92% → 96% (4 percentage point gain)",
+        'cultural_adaptation_target': ">85% accuracy across 10+ cultural styles",
+        'user_personalization_target': ">90% improvement within 10-20 interactions",
+        'cross_conversation_target': ">80% behavioral pattern accuracy",
+        'performance_requirement': "<200ms processing latency"
+    }
+    _STATIC_INTEGRATION_STATUS = {
+        'builds_on_existing_system': True,
+        'backward_compatible': True
+    }
+    
+    def __init__(self, blending_config: Optional[BlendingConfig] = None):
         # Initialize all adaptive learning components
         logger.info("🚀 Initializing Adaptive Validation Orchestrator...")
         
@@ -240,25 +411,51 @@ class AdaptiveValidationOrchestrator:
         # Performance and statistics tracking
         self.processing_stats = ProcessingStats()
         
+        # Shared pool for running the adaptive components concurrently
+        self._executor = ThreadPoolExecutor(max_workers=len(_COMPONENT_SPECS), thread_name_prefix="adaptive")
+        
+        # Circuit breaker: component name -> perf_counter() time before which the component is skipped
+        self._component_circuit_breaker: Dict[str, float] = {}
+        
+        # Latest submitted call per component; a component is not resubmitted while its call still runs
+        self._component_inflight: Dict[str, Future] = {}
+        
+        # Insights cache: user_id -> (perf_counter() time built, processing generation, insights)
+        self._insights_cache: Dict[Optional[str], Tuple[float, int, Dict[str, Any]]] = {}
+        self._insights_generation = 0  # Bumped whenever processing stats change
+        
         # Blending configuration
-        self.blending_config = {
-            'base_weight': 0.4,  # Weight for existing system baseline
-            'user_adaptation_weight': 0.25,  # Weight for user-specific adaptation
-            'cultural_intelligence_weight': 0.2,  # Weight for cultural adjustments
-            'behavioral_analysis_weight': 0.15,  # Weight for cross-conversation insights
-            
-            # Confidence thresholds for component activation
-            'min_user_confidence': 0.3,
-            'min_cultural_confidence': 0.4,
-            'min_behavioral_confidence': 0.3,
-            
-            # Performance requirements
-            'max_processing_time': 0.2,  # 200ms hard limit
-            'graceful_degradation': True  # Fall back to existing system if components fail
+        self.blending_config = blending_config if blending_config is not None else DEFAULT_BLENDING_CONFIG
+        self._reload_config()
+        
+        # Compile (or load from the on-disk cache) the weight kernel here rather than on the
+        # first request; doing it at construction keeps plain imports of this module cheap
+        if njit is not None:
+            _blend_weights(self._base_weights, np.ones(len(_COMPONENT_ORDER)), np.ones(len(_COMPONENT_ORDER)))
+        
+        # Component availability, fixed after initialization
+        self._components_available = {
+            'user_communication_learner': self.user_communication_learner is not None,
+            'cultural_intelligence_engine': self.cultural_intelligence_engine is not None,
+            'cross_conversation_analyzer': self.cross_conversation_analyzer is not None,
+            'existing_validation_learner': self.existing_validation_learner is not None,
+            'vector_database': self.vector_database is not None
         }
+        self._any_component = any(self._components_available.values())
         
         logger.info("🎯 Adaptive Validation Orchestrator ready for 92% → 96% accuracy improvement")
     
+    def _reload_config(self):
+        """Rebuild the cached blending arrays; call after replacing blending_config"""
+        cfg = self.blending_config
+        self._thresholds = np.array([
+            0.0, cfg.min_user_confidence, cfg.min_cultural_confidence, cfg.min_behavioral_confidence
+        ])
+        self._base_weights = np.array([
+            cfg.base_weight, cfg.user_adaptation_weight,
+            cfg.cultural_intelligence_weight, cfg.behavioral_analysis_weight
+        ])
+    
     def process_adaptive_validation(self, request: AdaptiveValidationRequest) -> AdaptiveValidationResult:
         """
         Main entry point for adaptive validation processing.
@@ -273,10 +470,10 @@ class AdaptiveValidationOrchestrator:
             AdaptiveValidationResult with blended adaptive predictions
         """
         # PERFORMANCE: Overall <200ms requirement
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            logger.info(f"🧠 Processing adaptive validation for user: {request.user_id or 'anonymous'}")
+            logger.info("Processing adaptive validation for user: %s", request.user_id or 'anonymous')
             
             # Initialize result structure
             result = AdaptiveValidationResult(
@@ -286,87 +483,93 @@ class AdaptiveValidationOrchestrator:
             
             components_processed = []
             component_results = {}
+            component_calls = {}
             
-            # 1. Process with existing LiveValidationLearner (baseline - ALWAYS include)
+            # 1. Existing LiveValidationLearner (baseline - ALWAYS include)
             if request.enable_existing_system and self.existing_validation_learner:
-                try:
-                    base_result = self.existing_validation_learner.process_validation_feedback(
-                        request.solution_context.get('solution_id', ''),
-                        request.solution_context.get('solution_content', ''),
-                        request.feedback_text,
-                        request.solution_context
-                    )
-                    
-                    result.base_validation = base_result
-                    component_results['base'] = base_result
-                    components_processed.append('existing_system')
-                    
-                    logger.debug("✅ Base validation processed")
-                    
-                except Exception as e:
-                    logger.warning(f"Base validation failed: {e}")
-                    result.base_validation = {'validation_strength': 0.5, 'error': str(e)}
-                    component_results['base'] = result.base_validation
+                component_calls['base'] = (
+                    self.existing_validation_learner.process_validation_feedback,
+                    request.solution_context.get('solution_id', ''),
+                    request.solution_context.get('solution_content', ''),
+                    request.feedback_text,
+                    request.solution_context
+                )
             
-            # 2. Apply user communication style adaptation
+            # 2. User communication style adaptation
             if (request.enable_user_adaptation and 
                 request.user_id and 
                 self.user_communication_learner):
-                try:
-                    user_result = self.user_communication_learner.predict_user_satisfaction_with_adaptation(
-                        request.user_id, request.feedback_text, request.solution_context
-                    )
-                    
-                    result.user_adaptation = user_result
-                    component_results['user'] = user_result
-                    components_processed.append('user_adaptation')
-                    
-                    logger.debug(f"✅ User adaptation processed: {user_result.get('user_adapted', False)}")
-                    
-                except Exception as e:
-                    logger.warning(f"User adaptation failed: {e}")
-                    result.user_adaptation = {'error': str(e), 'user_adapted': False}
-                    component_results['user'] = result.user_adaptation
+                component_calls['user'] = (
+                    self.user_communication_learner.predict_user_satisfaction_with_adaptation,
+                    request.user_id, request.feedback_text, request.solution_context
+                )
             
-            # 3. Apply cultural intelligence
+            # 3. Cultural intelligence
             if (request.enable_cultural_intelligence and 
                 request.user_cultural_profile and 
                 self.cultural_intelligence_engine):
-                try:
-                    cultural_result = self.cultural_intelligence_engine.analyze_with_cultural_intelligence(
-                        request.feedback_text, request.user_cultural_profile
-                    )
-                    
-                    result.cultural_analysis = cultural_result
-                    component_results['cultural'] = cultural_result
-                    components_processed.append('cultural_intelligence')
-                    
-                    logger.debug(f"✅ Cultural intelligence processed: {cultural_result.get('cultural_confidence', 0):.2f}")
-                    
-                except Exception as e:
-                    logger.warning(f"Cultural intelligence failed: {e}")
-                    result.cultural_analysis = {'error': str(e), 'cultural_confidence': 0.0}
-                    component_results['cultural'] = result.cultural_analysis
+                component_calls['cultural'] = (
+                    self.cultural_intelligence_engine.analyze_with_cultural_intelligence,
+                    request.feedback_text, request.user_cultural_profile
+                )
             
-            # 4. Apply cross-conversation behavioral analysis
+            # 4. Cross-conversation behavioral analysis
             if (request.enable_cross_conversation_analysis and 
                 request.user_id and 
                 self.cross_conversation_analyzer):
+                component_calls['behavioral'] = (
+                    self.cross_conversation_analyzer.analyze_user_behavior_patterns,
+                    request.user_id, request.feedback_text, request.solution_context
+                )
+            
+            # Run the independent components concurrently within the remaining time budget,
+            # skipping any component whose circuit breaker is still open after a recent failure
+            # or whose call from an earlier request has not finished yet (running threads cannot
+            # be cancelled, so resubmitting would pile calls up behind it on the pool)
+            circuit_breaker = self._component_circuit_breaker
+            inflight = self._component_inflight
+            futures = {}
+            for name, call in component_calls.items():
+                running = inflight.get(name)
+                if start_time < circuit_breaker.get(name, 0.0):
+                    futures[name] = _CIRCUIT_OPEN_RESULTS[name]
+                elif running is not None and not running.done():
+                    futures[name] = _STILL_RUNNING_RESULTS[name]
+                else:
+                    futures[name] = inflight[name] = self._executor.submit(*call)
+            remaining_budget = max(0.0, request.max_processing_time - (time.perf_counter() - start_time))
+            wait([future for future in futures.values() if isinstance(future, Future)], timeout=remaining_budget)
+            
+            for name, future in futures.items():
+                result_attr, usage_name, fallback = _COMPONENT_SPECS[name]
+                if not isinstance(future, Future):
+                    # Skipped component: record its canned fallback result
+                    component_result = dict(future)
+                    setattr(result, result_attr, component_result)
+                    component_results[name] = component_result
+                    continue
+                if not future.done():
+                    # Over budget is not a failure: fall back for this request but leave the breaker closed.
+                    # The call keeps running and blocks resubmission of this component until it finishes
+                    logger.warning("Adaptive component %s exceeded %.3fs budget", name, request.max_processing_time)
+                    component_result = {'error': f"exceeded {request.max_processing_time:.3f}s budget", **fallback}
+                    setattr(result, result_attr, component_result)
+                    component_results[name] = component_result
+                    continue
                 try:
-                    behavioral_result = self.cross_conversation_analyzer.analyze_user_behavior_patterns(
-                        request.user_id, request.feedback_text, request.solution_context
-                    )
-                    
-                    result.behavioral_analysis = behavioral_result
-                    component_results['behavioral'] = behavioral_result
-                    components_processed.append('cross_conversation')
-                    
-                    logger.debug(f"✅ Behavioral analysis processed: {behavioral_result.get('behavioral_analysis_available', False)}")
-                    
+                    component_result = future.result(timeout=0)
+                    components_processed.append(usage_name)
+                    circuit_breaker.pop(name, None)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Adaptive component processed: %s", name)
                 except Exception as e:
-                    logger.warning(f"Behavioral analysis failed: {e}")
-                    result.behavioral_analysis = {'error': str(e), 'behavioral_analysis_available': False}
-                    component_results['behavioral'] = result.behavioral_analysis
+                    # Graceful degradation - record the failure, open the breaker and keep blending the rest
+                    logger.warning("Adaptive component %s failed: %s", name, e)
+                    component_result = {'error': str(e), **fallback}
+                    circuit_breaker[name] = time.perf_counter() + COMPONENT_RETRY_COOLDOWN
+                
+                setattr(result, result_attr, component_result)
+                component_results[name] = component_result
             
             # 5. Blend all adaptive predictions intelligently
             blended_validation = self._blend_adaptive_predictions(component_results, request)
@@ -385,7 +588,7 @@ class AdaptiveValidationOrchestrator:
             result.confidence_increase = result.adaptation_confidence - 0.5  # Base confidence
             
             # Performance tracking
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             result.processing_time = processing_time
             result.performance_compliant = processing_time <= request.max_processing_time
             result.components_processed = components_processed
@@ -395,28 +598,30 @@ class AdaptiveValidationOrchestrator:
                 processing_time, components_processed, 
                 result.improvement_over_baseline, result.confidence_increase
             )
+            self._insights_generation += 1
             
             # Performance compliance check
             if not result.performance_compliant:
-                logger.warning(f"⚠️ Adaptive validation exceeded {request.max_processing_time:.0f}ms: {processing_time:.3f}s")
+                logger.warning("Adaptive validation exceeded %.0fms: %.3fs",
+                               request.max_processing_time * 1000, processing_time)
             
-            logger.info(f"🎯 Adaptive validation complete: "
-                       f"Strength {result.final_validation_strength:.2f} "
-                       f"(+{result.improvement_over_baseline:+.2f}), "
-                       f"Confidence {result.adaptation_confidence:.2f}, "
-                       f"Time {processing_time:.3f}s")
+            logger.info("Adaptive validation complete: Strength %.2f (%+.2f), Confidence %.2f, Time %.3fs",
+                        result.final_validation_strength, result.improvement_over_baseline,
+                        result.adaptation_confidence, processing_time)
             
             return result
             
         except Exception as e:
-            processing_time = time.time() - start_time
-            logger.error(f"Critical error in adaptive validation: {e}")
+            processing_time = time.perf_counter() - start_time
+            logger.error("Critical error in adaptive validation: %s", e)
             
             # Graceful degradation - return minimal result
             return AdaptiveValidationResult(
                 final_validation_strength=0.5,
                 adaptation_confidence=0.0,
-                adaptation_explanation=f"Adaptive validation failed: {str(e)}",
+                adaptation_explanation="Adaptive validation failed",
+                error_type=type(e).__name__,
+                error_message=str(e),
                 processing_time=processing_time,
                 performance_compliant=processing_time <= request.max_processing_time,
                 components_processed=['fallback']
@@ -430,111 +635,116 @@ class AdaptiveValidationOrchestrator:
         Uses confidence-weighted blending with dynamic weight adjustment
         based on component reliability and user context.
         """
-        # Extract predictions and confidences from each component
-        predictions = {}
-        confidences = {}
+        # Extract predictions and confidences from each component (indexed by _COMPONENT_ORDER)
+        predictions = np.zeros(len(_COMPONENT_ORDER))
+        confidences = np.zeros(len(_COMPONENT_ORDER))
+        present = np.zeros(len(_COMPONENT_ORDER), dtype=bool)
         
         # Base validation (existing system)
-        if 'base' in component_results:
-            base_result = component_results['base']
-            predictions['base'] = base_result.get('validation_strength', 0.5)
-            confidences['base'] = 0.8  # High confidence in existing system
+        base_result = component_results.get('base')
+        if base_result is not None:
+            predictions[0] = base_result.get('validation_strength', 0.5)
+            confidences[0] = 0.8  # High confidence in existing system
+            present[0] = True
         
         # User adaptation
-        if 'user' in component_results:
-            user_result = component_results['user']
-            if user_result.get('user_adapted', False):
-                predictions['user'] = user_result.get('satisfaction_score', 0.5)
-                confidences['user'] = user_result.get('adaptation_confidence', 0.0)
+        user_result = component_results.get('user', _NO_RESULT)
+        if user_result.get('user_adapted', False):
+            predictions[1] = user_result.get('satisfaction_score', 0.5)
+            confidences[1] = user_result.get('adaptation_confidence', 0.0)
+            present[1] = True
         
         # Cultural intelligence
-        if 'cultural' in component_results:
-            cultural_result = component_results['cultural']
-            if 'culturally_adjusted_sentiment' in cultural_result:
-                cultural_sentiment = cultural_result['culturally_adjusted_sentiment']
-                # Convert sentiment to validation strength
-                if cultural_sentiment.get('label') in ['POSITIVE', 'positive']:
-                    predictions['cultural'] = cultural_sentiment.get('score', 0.5)
-                elif cultural_sentiment.get('label') in ['NEGATIVE', 'negative']:
-                    predictions['cultural'] = 1.0 - cultural_sentiment.get('score', 0.5)
-                else:
-                    predictions['cultural'] = 0.5
-                
-                confidences['cultural'] = cultural_result.get('cultural_confidence', 0.0)
+        cultural_result = component_results.get('cultural', _NO_RESULT)
+        cultural_sentiment = cultural_result.get('culturally_adjusted_sentiment')
+        if cultural_sentiment is not None:
+            # Convert sentiment to validation strength
+            label = cultural_sentiment.get('label')
+            if label in _POS_LABELS:
+                predictions[2] = cultural_sentiment.get('score', 0.5)
+            elif label in _NEG_LABELS:
+                predictions[2] = 1.0 - cultural_sentiment.get('score', 0.5)
+            else:
+                predictions[2] = 0.5
+            
+            confidences[2] = cultural_result.get('cultural_confidence', 0.0)
+            present[2] = True
         
         # Behavioral analysis
-        if 'behavioral' in component_results:
-            behavioral_result = component_results['behavioral']
-            if behavioral_result.get('behavioral_analysis_available', False):
-                # Use satisfaction trend adjustment as prediction modifier
-                base_prediction = predictions.get('base', 0.5)
-                trend_adjustment = behavioral_result.get('satisfaction_trend_adjustment', 1.0)
-                predictions['behavioral'] = base_prediction * trend_adjustment
-                confidences['behavioral'] = behavioral_result.get('behavioral_confidence', 0.0)
-        
-        # Apply confidence thresholds
-        filtered_predictions = {}
-        filtered_confidences = {}
-        
-        for component, prediction in predictions.items():
-            confidence = confidences.get(component, 0.0)
-            
-            # Apply minimum confidence thresholds
-            if component == 'base':
-                # Always include base prediction
-                filtered_predictions[component] = prediction
-                filtered_confidences[component] = confidence
-            elif component == 'user' and confidence >= self.blending_config['min_user_confidence']:
-                filtered_predictions[component] = prediction
-                filtered_confidences[component] = confidence
-            elif component == 'cultural' and confidence >= self.blending_config['min_cultural_confidence']:
-                filtered_predictions[component] = prediction
-                filtered_confidences[component] = confidence
-            elif component == 'behavioral' and confidence >= self.blending_config['min_behavioral_confidence']:
-                filtered_predictions[component] = prediction
-                filtered_confidences[component] = confidence
-        
-        # Calculate dynamic weights based on confidences
-        blending_weights = self._calculate_dynamic_weights(filtered_confidences)
+        behavioral_result = component_results.get('behavioral', _NO_RESULT)
+        if behavioral_result.get('behavioral_analysis_available', False):
+            # Use satisfaction trend adjustment as prediction modifier
+            base_prediction = predictions[0] if present[0] else 0.5
+            trend_adjustment = behavioral_result.get('satisfaction_trend_adjustment', 1.0)
+            predictions[3] = base_prediction * trend_adjustment
+            confidences[3] = behavioral_result.get('behavioral_confidence', 0.0)
+            present[3] = True
+        
+        # Apply minimum confidence thresholds (zero threshold always includes base prediction)
+        mask = present & (confidences >= self._thresholds)
+        active = [component for component, keep in zip(_COMPONENT_ORDER, mask) if keep]
+        
+        # Fast paths: nothing usable, or only the base prediction survived thresholding
+        if not active:
+            return {
+                'validation_strength': 0.5,
+                'adaptation_confidence': 0.0,
+                'blending_weights': {'fallback': 1.0},
+                'component_contributions': {},
+                'explanation': _FALLBACK_EXPLANATION if request.enable_explanation else "",
+                'recommendations': (
+                    self._generate_adaptive_recommendations(component_results, 0.5, 0.0)
+                    if request.enable_recommendations else []
+                ),
+                'components_used': []
+            }
+        
+        if active == ['base']:
+            base_prediction = float(predictions[0])
+            base_confidence = float(confidences[0])
+            blended_strength = max(0.0, min(1.0, base_prediction))
+            adaptation_confidence = max(0.0, min(1.0, base_confidence))
+            return {
+                'validation_strength': blended_strength,
+                'adaptation_confidence': adaptation_confidence,
+                'blending_weights': {'base': 1.0},
+                'component_contributions': {'base': abs(base_prediction - 0.5)},
+                'explanation': _BASE_ONLY_EXPLANATION % base_prediction if request.enable_explanation else "",
+                'recommendations': (
+                    self._generate_adaptive_recommendations(component_results, blended_strength, adaptation_confidence)
+                    if request.enable_recommendations else []
+                ),
+                'components_used': ['base']
+            }
         
         # Blend predictions using confidence-weighted average
-        if filtered_predictions:
-            blended_strength = sum(
-                blending_weights.get(component, 0) * prediction 
-                for component, prediction in filtered_predictions.items()
-            )
-            
-            # Calculate overall adaptation confidence
-            adaptation_confidence = sum(
-                blending_weights.get(component, 0) * confidence 
-                for component, confidence in filtered_confidences.items()
-            )
-        else:
-            # Fallback to neutral
-            blended_strength = 0.5
-            adaptation_confidence = 0.0
-            blending_weights = {'fallback': 1.0}
+        weights = self._calculate_dynamic_weights(confidences, mask)
+        blended_strength = float(weights @ predictions)
+        adaptation_confidence = float(weights @ confidences)
+        contributions = np.abs(predictions - 0.5) * weights
+        
+        index = {component: i for i, component in enumerate(_COMPONENT_ORDER)}
+        filtered_predictions = {component: float(predictions[index[component]]) for component in active}
+        blending_weights = {component: float(weights[index[component]]) for component in active}
+        component_contributions = {component: float(contributions[index[component]]) for component in active}
         
         # Ensure valid range
         blended_strength = max(0.0, min(1.0, blended_strength))
         adaptation_confidence = max(0.0, min(1.0, adaptation_confidence))
         
-        # Calculate component contributions
-        component_contributions = {}
-        for component in filtered_predictions:
-            component_contributions[component] = abs(
-                filtered_predictions[component] - 0.5
-            ) * blending_weights.get(component, 0)
-        
         # Generate explanation
-        explanation = self._generate_blending_explanation(
-            filtered_predictions, blending_weights, component_results
-        )
+        explanation = ""
+        if request.enable_explanation:
+            explanation = self._generate_blending_explanation(
+                filtered_predictions, blending_weights, component_results
+            )
         
         # Generate recommendations
-        recommendations = self._generate_adaptive_recommendations(
-            component_results, blended_strength, adaptation_confidence
-        )
+        recommendations = []
+        if request.enable_recommendations:
+            recommendations = self._generate_adaptive_recommendations(
+                component_results, blended_strength, adaptation_confidence
+            )
         
         return {
             'validation_strength': blended_strength,
@@ -543,47 +753,21 @@ class AdaptiveValidationOrchestrator:
             'component_contributions': component_contributions,
             'explanation': explanation,
             'recommendations': recommendations,
-            'components_used': list(filtered_predictions.keys())
+            'components_used': active
         }
     
-    def _calculate_dynamic_weights(self, confidences: Dict[str, float]) -> Dict[str, float]:
-        """Calculate dynamic blending weights based on component confidences"""
-        if not confidences:
-            return {}
-        
-        # Start with base configuration weights
-        base_weights = {
-            'base': self.blending_config['base_weight'],
-            'user': self.blending_config['user_adaptation_weight'],
-            'cultural': self.blending_config['cultural_intelligence_weight'],
-            'behavioral': self.blending_config['behavioral_analysis_weight']
-        }
+    def _calculate_dynamic_weights(self, confidences: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        Calculate dynamic blending weights based on component confidences.
         
-        # Adjust weights based on confidence
-        adjusted_weights = {}
-        for component, confidence in confidences.items():
-            base_weight = base_weights.get(component, 0.1)
+        Args:
+            confidences: Per-component confidences in _COMPONENT_ORDER
+            mask: Components that passed their confidence thresholds
             
-            # Higher confidence gets higher weight
-            confidence_multiplier = 0.5 + (confidence * 1.5)  # 0.5 to 2.0 multiplier
-            adjusted_weights[component] = base_weight * confidence_multiplier
-        
-        # Normalize weights to sum to 1.0
-        total_weight = sum(adjusted_weights.values())
-        if total_weight > 0:
-            normalized_weights = {
-                component: weight / total_weight 
-                for component, weight in adjusted_weights.items()
-            }
-        else:
-            # Fallback to equal weights
-            num_components = len(confidences)
-            normalized_weights = {
-                component: 1.0 / num_components 
-                for component in confidences.keys()
-            }
-        
-        return normalized_weights
+        Returns:
+            Normalized weights in _COMPONENT_ORDER (zero for masked-out components)
+        """
+        return _blend_weights(self._base_weights, confidences, mask.astype(np.float64))
     
     def _generate_blending_explanation(self, predictions: Dict[str, float], 
                                      weights: Dict[str, float], 
@@ -591,97 +775,61 @@ class AdaptiveValidationOrchestrator:
         """Generate human-readable explanation of adaptive blending"""
         explanations = []
         
-        # Base system explanation
-        if 'base' in predictions:
-            base_strength = predictions['base']
-            base_weight = weights.get('base', 0)
-            explanations.append(f"Existing system: {base_strength:.2f} (weight: {base_weight:.1%})")
-        
-        # User adaptation explanation
-        if 'user' in predictions:
-            user_result = component_results.get('user', {})
-            user_strength = predictions['user']
-            user_weight = weights.get('user', 0)
-            profile_strength = user_result.get('user_profile_strength', 0)
-            explanations.append(f"User adaptation: {user_strength:.2f} (weight: {user_weight:.1%}, profile: {profile_strength:.2f})")
-        
-        # Cultural intelligence explanation
-        if 'cultural' in predictions:
-            cultural_result = component_results.get('cultural', {})
-            cultural_strength = predictions['cultural']
-            cultural_weight = weights.get('cultural', 0)
-            cultural_confidence = cultural_result.get('cultural_confidence', 0)
-            language = cultural_result.get('language_detected', 'unknown')
-            explanations.append(f"Cultural intelligence: {cultural_strength:.2f} (weight: {cultural_weight:.1%}, {language}, conf: {cultural_confidence:.2f})")
-        
-        # Behavioral analysis explanation
-        if 'behavioral' in predictions:
-            behavioral_result = component_results.get('behavioral', {})
-            behavioral_strength = predictions['behavioral']
-            behavioral_weight = weights.get('behavioral', 0)
-            behavioral_confidence = behavioral_result.get('behavioral_confidence', 0)
-            explanations.append(f"Behavioral analysis: {behavioral_strength:.2f} (weight: {behavioral_weight:.1%}, conf: {behavioral_confidence:.2f})")
+        for component, template, extra_fields in _EXPLANATION_TEMPLATES:
+            if component in predictions:
+                component_result = component_results.get(component, {})
+                values = {name: component_result.get(key, default) for name, key, default in extra_fields}
+                values['strength'] = predictions[component]
+                values['weight'] = weights.get(component, 0)
+                explanations.append(template.format_map(values))
         
         if explanations:
             return "Adaptive blending: " + "; ".join(explanations)
         else:
-            return "Adaptive validation unavailable - using fallback"
+            return _FALLBACK_EXPLANATION
     
     def _generate_adaptive_recommendations(self, component_results: Dict[str, Dict[str, Any]], 
                                          final_strength: float, 
                                          confidence: float) -> List[str]:
         """Generate actionable recommendations based on adaptive analysis"""
-        recommendations = []
-        
-        # Confidence-based recommendations
-        if confidence < 0.3:
-            recommendations.append("Low adaptation confidence - consider collecting more user feedback for learning")
-        elif confidence > 0.8:
-            recommendations.append("High adaptation confidence - user patterns well established")
-        
-        # User adaptation recommendations
-        if 'user' in component_results:
-            user_result = component_results['user']
-            if user_result.get('learning_opportunity', False):
-                recommendations.append("New user detected - initial feedback will improve future predictions")
-            
-            profile_strength = user_result.get('user_profile_strength', 0)
-            if profile_strength > 0.7:
-                recommendations.append("Strong user profile available - personalized predictions highly reliable")
-        
-        # Cultural intelligence recommendations
-        if 'cultural' in component_results:
-            cultural_result = component_results['cultural']
-            if cultural_result.get('bias_prevention_applied', False):
-                recommendations.append("Cultural bias prevention applied - adjustments kept within ethical limits")
-            
-            cultural_confidence = cultural_result.get('cultural_confidence', 0)
-            if cultural_confidence > 0.6:
-                recommendations.append("Strong cultural adaptation applied - feedback interpreted with cultural context")
-        
-        # Behavioral analysis recommendations
-        if 'behavioral' in component_results:
-            behavioral_result = component_results['behavioral']
-            if behavioral_result.get('behavioral_analysis_available', False):
-                behavioral_confidence = behavioral_result.get('behavioral_confidence', 0)
-                if behavioral_confidence > 0.5:
-                    recommendations.append("Cross-conversation patterns detected - behavioral insights applied")
-                
-                # Specific behavioral recommendations
-                behavioral_insights = behavioral_result.get('behavioral_insights', {})
-                if behavioral_insights.get('user_reliability', 0) < 0.5:
-                    recommendations.append("Monitor follow-up behavior to validate feedback accuracy")
+        # Every recommendation is gated by a threshold test, so the test outcomes packed into
+        # one int (bit i -> _RECOMMENDATION_TEXTS[i]) fully determine the output and key the cache
+        flags = (
+            (confidence < 0.3)
+            | (confidence > 0.8) << 1
+            | (final_strength > 0.8) << 8
+            | (final_strength < 0.3) << 9
+        )
+        for bit, component, key, threshold in _COMPONENT_RECOMMENDATION_RULES:
+            value = component_results.get(component, _NO_RESULT).get(key, 0)
+            if (value > threshold) if threshold is not None else value:
+                flags |= 1 << bit
         
-        # Final strength recommendations
-        if final_strength > 0.8:
-            recommendations.append("High validation strength - solution likely very effective")
-        elif final_strength < 0.3:
-            recommendations.append("Low validation strength - consider alternative approaches")
+        # Behavioral rules only apply when cross-conversation analysis produced a result
+        behavioral_result = component_results.get('behavioral', _NO_RESULT)
+        if behavioral_result.get('behavioral_analysis_available', False):
+            flags |= (behavioral_result.get('behavioral_confidence', 0) > 0.5) << 6
+            if (insights := behavioral_result.get('behavioral_insights')) is None or insights.get('user_reliability', 0) < 0.5:
+                flags |= 1 << 7
         
-        return recommendations[:5]  # Limit to top 5 recommendations
+        return list(_recommendations_for(flags))
     
     def get_adaptive_learning_insights(self, user_id: Optional[str] = None) -> Dict[str, Any]:
-        """Get comprehensive insights about adaptive learning performance"""
+        """
+        Get comprehensive insights about adaptive learning performance.
+        
+        Reports are cached per user_id for INSIGHTS_CACHE_TTL seconds, or until the
+        next processed request. Callers get their own top-level dict; nested sections
+        are shared with the cache and must not be mutated.
+        """
+        now = time.perf_counter()
+        cached = self._insights_cache.get(user_id)
+        if cached is not None:
+            built_at, generation, insights = cached
+            if generation == self._insights_generation and now - built_at < INSIGHTS_CACHE_TTL:
+                return dict(insights)
+        
+        generation = self._insights_generation
         insights = {
             'system_performance': self.processing_stats.get_performance_metrics(),
             'orchestrator_health': self._get_orchestrator_health(),
@@ -695,51 +843,59 @@ class AdaptiveValidationOrchestrator:
         # System-wide insights
         insights['system_insights'] = self._get_system_wide_insights()
         
-        return insights
+        # Entries only live for INSIGHTS_CACHE_TTL, so dropping them all keeps the cache bounded
+        if len(self._insights_cache) >= 256:
+            self._insights_cache.clear()
+        self._insights_cache[user_id] = (now, generation, insights)
+        return dict(insights)
     
     def _get_orchestrator_health(self) -> Dict[str, Any]:
         """Get orchestrator health status"""
         return {
-            'components_initialized': {
-                'user_communication_learner': self.user_communication_learner is not None,
-                'cultural_intelligence_engine': self.cultural_intelligence_engine is not None,
-                'cross_conversation_analyzer': self.cross_conversation_analyzer is not None,
-                'existing_validation_learner': self.existing_validation_learner is not None,
-                'vector_database': self.vector_database is not None
-            },
-            'blending_configuration': self.blending_config,
+            'components_initialized': dict(self._components_available),
+            'blending_configuration': asdict(self.blending_config),
             'processing_stats_available': True
         }
     
     def _get_component_status(self) -> Dict[str, Any]:
         """Get status of all adaptive learning components"""
-        status = {}
+        if not self._any_component:
+            return {}
+        
+        available = self._components_available
+        getters = {}
         
         # User communication learner status
-        if self.user_communication_learner:
-            status['user_communication'] = self.user_communication_learner.get_system_learning_insights()
+        if available['user_communication_learner']:
+            getters['user_communication'] = self.user_communication_learner.get_system_learning_insights
         
         # Cultural intelligence engine status
-        if self.cultural_intelligence_engine:
-            status['cultural_intelligence'] = self.cultural_intelligence_engine.get_cultural_intelligence_insights()
+        if available['cultural_intelligence_engine']:
+            getters['cultural_intelligence'] = self.cultural_intelligence_engine.get_cultural_intelligence_insights
         
         # Cross-conversation analyzer status
-        if self.cross_conversation_analyzer:
-            status['cross_conversation'] = self.cross_conversation_analyzer.get_cross_conversation_insights()
+        if available['cross_conversation_analyzer']:
+            getters['cross_conversation'] = self.cross_conversation_analyzer.get_cross_conversation_insights
         
-        return status
+        # The getters only aggregate in-memory stats, so they run inline: queueing them on the
+        # component pool could block behind abandoned, still-running component calls
+        return {name: getter() for name, getter in getters.items()}
     
     def _get_user_specific_insights(self, user_id: str) -> Dict[str, Any]:
         """Get insights specific to a user"""
         user_insights = {}
+        available = self._components_available
         
         # User communication insights
-        if self.user_communication_learner:
+        if available['user_communication_learner']:
             user_insights['communication_learning'] = self.user_communication_learner.get_user_learning_insights(user_id)
         
         # Cross-conversation insights
-        if self.cross_conversation_analyzer and user_id in self.cross_conversation_analyzer.user_profiles:
-            profile = self.cross_conversation_analyzer.user_profiles[user_id]
+        profile = (
+            self.cross_conversation_analyzer.user_profiles.get(user_id)
+            if available['cross_conversation_analyzer'] else None
+        )
+        if profile is not None:
             user_insights['behavioral_profile'] = {
                 'total_conversations': profile.total_conversations,
                 'behavioral_confidence': profile.get_behavioral_confidence(),
@@ -756,17 +912,11 @@ class AdaptiveValidationOrchestrator:
     def _get_system_wide_insights(self) -> Dict[str, Any]:
         """Get system-wide adaptive learning insights"""
         return {
-            'accuracy_improvement_target': "92% → 96% (4 percentage point gain)",
-            'cultural_adaptation_target': ">85% accuracy across 10+ cultural styles",
-            'user_personalization_target': ">90% improvement within 10-20 interactions",
-            'cross_conversation_target': ">80% behavioral pattern accuracy",
-            'performance_requirement': "<200ms processing latency",
-            
+            **self._STATIC_SYSTEM_TARGETS,
             'current_performance': self.processing_stats.get_performance_metrics(),
             'integration_status': {
-                'builds_on_existing_system': True,
-                'backward_compatible': True,
-                'graceful_degradation': self.blending_config['graceful_degradation']
+                **self._STATIC_INTEGRATION_STATUS,
+                'graceful_degradation': self.blending_config.graceful_degradation
             }
         }
 
@@ -793,7 +943,9 @@ def test_adaptive_validation_orchestrator():
             'language': 'en',
             'communication_style': 'direct',
             'politeness_level': 'medium'
-        }
+        },
+        enable_explanation=True,
+        enable_recommendations=True
     )
     
     result = orchestrator.process_adaptive_validation(request)
@@ -826,5 +978,7 @@ def test_adaptive_validation_orchestrator():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Run comprehensive functionality test
     test_orchestrator = test_adaptive_validation_orchestrator()
\ No newline at end of file
@@ -7,12 +7,14 @@ Based on PRP-3: Adaptive Learning Validation System (July 2025)
 Uses latest sentiment analysis models with cultural communication pattern awareness.
 """
 
+import re
 import time
 import logging
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Tuple
 import json
-import numpy as np
 from datetime import datetime
 
 # Transformers 4.53.3 for multi-language sentiment analysis
@@ -23,6 +25,12 @@ except ImportError as e:
     logging.error(f"Transformers not available - install with: pip install transformers torch")
     raise ImportError("Transformers framework required for cultural intelligence") from e
 
+# Optimum is optional - without it the sentiment pipelines run on PyTorch
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+except ImportError:
+    ORTModelForSequenceClassification = None
+
 # Language detection
 try:
     import langdetect
@@ -35,6 +43,14 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Lowercase cues that signal politeness may be masking the true sentiment
+_POLITENESS_MASKING_CUES = ('thank', 'please')
+
+# Keyword fallback sentiment vocabulary, matched against whole lowercase tokens
+_FALLBACK_POSITIVE_WORDS = frozenset(['great', 'excellent', 'perfect', 'works', 'good', 'helpful', 'thanks'])
+_FALLBACK_NEGATIVE_WORDS = frozenset(['wrong', 'broken', 'failed', 'error', 'bad', 'issue', 'problem'])
+_FALLBACK_TOKEN_RE = re.compile(r"[a-z']+")
+
 
 @dataclass
 class CulturalIntelligenceContext:
@@ -77,13 +93,17 @@ class CulturalIntelligenceEngine:
     """
     
     def __init__(self):
-        # Sentiment analysis models for different languages (Transformers 4.53.3)
+        # Sentiment analysis models for different languages (Transformers 4.53.3), loaded lazily
         self.sentiment_models = {}
         self._initialize_sentiment_models()
         
         # Cultural communication patterns (from cultural intelligence guide)
         self.cultural_patterns = self._load_cultural_patterns()
         
+        # Direct language -> style lookups derived from the patterns above
+        self._directness_by_language = self._build_language_lookup('direct_cultures', 'indirect_cultures')
+        self._context_by_language = self._build_language_lookup('high_context', 'low_context')
+        
         # Bias prevention thresholds (critical for ethical AI)
         self.bias_prevention = {
             'max_cultural_boost': 1.5,  # Maximum cultural adjustment
@@ -100,38 +120,62 @@ class CulturalIntelligenceEngine:
             'performance_violations': 0
         }
         
-        # Cultural adjustment cache for performance
-        self.cultural_cache = {}
+        # Cultural analysis LRU for performance, keyed by (language, directness, politeness, text)
+        self.cultural_cache: OrderedDict = OrderedDict()
         self.cache_max_size = 1000
         
+        # Base sentiment LRU keyed by (model_key, text) - feedback repeats a lot of boilerplate
+        self._sentiment_cache: OrderedDict = OrderedDict()
+        self.sentiment_cache_max_size = 4096
+        
+        # Guards both LRUs - analyses run concurrently on the orchestrator's thread pool
+        self._cache_lock = threading.Lock()
+        
         logger.info("🌍 Cultural Intelligence Engine initialized with multi-language support")
     
     def _initialize_sentiment_models(self):
-        """Initialize sentiment analysis models for different languages"""
-        try:
+        """Register sentiment analysis models for different languages (loaded on first use)"""
+        self._model_ids = {
             # English model (latest sentiment analysis)
-            self.sentiment_models['english'] = pipeline(
-                "sentiment-analysis",
-                model="cardiffnlp/twitter-roberta-base-sentiment-latest",
-                return_all_scores=True
-            )
-            
+            'english': "cardiffnlp/twitter-roberta-base-sentiment-latest",
             # Multilingual model
-            self.sentiment_models['multilingual'] = pipeline(
-                "sentiment-analysis",
-                model="nlptown/bert-base-multilingual-uncased-sentiment",
-                return_all_scores=True
-            )
-            
-            logger.info("✅ Sentiment analysis models loaded successfully")
-            
-        except Exception as e:
-            logger.error(f"Failed to load sentiment models: {e}")
-            # Create fallback models
-            self.sentiment_models = {
-                'english': None,
-                'multilingual': None
-            }
+            'multilingual': "nlptown/bert-base-multilingual-uncased-sentiment"
+        }
+        self._model_lock = threading.Lock()
+    
+    def _get_model(self, model_key: str):
+        """Return the sentiment pipeline for model_key, loading it on first use (None if unavailable)"""
+        if model_key in self.sentiment_models:
+            return self.sentiment_models[model_key]
+        
+        with self._model_lock:
+            if model_key not in self.sentiment_models:
+                try:
+                    self.sentiment_models[model_key] = self._create_sentiment_pipeline(self._model_ids[model_key])
+                    logger.info(f"✅ Sentiment analysis model loaded: {model_key}")
+                except Exception as e:
+                    logger.error(f"Failed to load sentiment model {model_key}: {e}")
+                    # Fall back to keyword sentiment without retrying every call
+                    self.sentiment_models[model_key] = None
+            return self.sentiment_models[model_key]
+    
+    def _create_sentiment_pipeline(self, model_id: str):
+        """Build a sentiment pipeline, exported to ONNX Runtime (CPU) when optimum is installed"""
+        if ORTModelForSequenceClassification is not None:
+            try:
+                model = ORTModelForSequenceClassification.from_pretrained(
+                    model_id, export=True, provider="CPUExecutionProvider"
+                )
+                return pipeline(
+                    "sentiment-analysis",
+                    model=model,
+                    tokenizer=AutoTokenizer.from_pretrained(model_id),
+                    return_all_scores=True
+                )
+            except Exception as e:
+                logger.warning(f"ONNX Runtime export failed for {model_id}, using PyTorch: {e}")
+        
+        return pipeline("sentiment-analysis", model=model_id, return_all_scores=True)
     
     def _load_cultural_patterns(self) -> Dict[str, Any]:
         """Load cultural communication patterns"""
@@ -176,6 +220,15 @@ class CulturalIntelligenceEngine:
             }
         }
     
+    def _build_language_lookup(self, *pattern_names: str) -> Dict[str, str]:
+        """Map each language to its style; earlier pattern names take precedence"""
+        lookup = {}
+        for pattern_name in pattern_names:
+            style = pattern_name.replace('_cultures', '')
+            for language in self.cultural_patterns[pattern_name]['languages']:
+                lookup.setdefault(language, style)
+        return lookup
+    
     def analyze_with_cultural_intelligence(self, feedback_text: str, 
                                          user_cultural_profile: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -188,24 +241,94 @@ class CulturalIntelligenceEngine:
         Returns:
             Dictionary with culturally-adjusted analysis results
         """
+        return self.analyze_batch([feedback_text], [user_cultural_profile])[0]
+    
+    def analyze_batch(self, feedback_texts: List[str], 
+                      user_cultural_profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several feedback texts with one batched sentiment call per model.
+        
+        Args:
+            feedback_texts: Users' feedback texts
+            user_cultural_profiles: Cultural profile for each feedback text
+            
+        Returns:
+            Culturally-adjusted analysis results, in input order
+        """
+        if len(feedback_texts) != len(user_cultural_profiles):
+            raise ValueError(
+                f"Got {len(feedback_texts)} feedback texts but {len(user_cultural_profiles)} cultural profiles"
+            )
+        
         # PERFORMANCE: Timing for <200ms compliance
         start_time = time.time()
         
+        results: List[Optional[Dict[str, Any]]] = [None] * len(feedback_texts)
+        languages: Dict[int, str] = {}
+        lowered: Dict[int, str] = {}
+        cache_keys: Dict[int, Tuple[str, str, str, str]] = {}
+        
+        # Detect languages once, before any model is invoked
+        for index, (feedback_text, user_cultural_profile) in enumerate(zip(feedback_texts, user_cultural_profiles)):
+            try:
+                language = user_cultural_profile.get('language', 'auto')
+                if language == 'auto':
+                    language = self._detect_language(feedback_text)
+                
+                # Identical text under the same cultural reading yields the same analysis
+                cache_key = (
+                    language,
+                    self._determine_communication_directness(language, user_cultural_profile),
+                    user_cultural_profile.get('politeness_level', 'medium'),
+                    feedback_text
+                )
+                cached = self._lru_get(self.cultural_cache, cache_key)
+                if cached is not None:
+                    results[index] = self._replay_cached_analysis(cached, time.time() - start_time)
+                    continue
+                
+                # Lowered once here and shared by the fallback sentiment and marker checks
+                lowered[index] = feedback_text.lower()
+                languages[index] = language
+                cache_keys[index] = cache_key
+            except Exception as e:
+                results[index] = self._analysis_error_result(e, time.time() - start_time)
+        
+        # Get base sentiment analysis, batched per model
+        base_sentiments = self._get_base_sentiments(
+            [feedback_texts[index] for index in languages], list(languages.values()), list(lowered.values())
+        )
+        
+        # Each analysis is charged an equal share of the batched inference time
+        shared_time = (time.time() - start_time) / max(1, len(languages))
+        
+        for (index, language), base_sentiment in zip(languages.items(), base_sentiments):
+            results[index] = self._analyze_from_sentiment(
+                feedback_texts[index], user_cultural_profiles[index], language, base_sentiment, shared_time,
+                lowered[index]
+            )
+            # Keyword fallbacks caused by a failing model are transient and must not outlive it
+            if 'error' not in results[index] and (
+                base_sentiment.get('model_used') != 'fallback'
+                or self.sentiment_models.get(self._model_key_for(language), False) is None
+            ):
+                self._lru_put(self.cultural_cache, cache_keys[index], dict(results[index]), self.cache_max_size)
+        
+        return results
+    
+    def _analyze_from_sentiment(self, feedback_text: str, user_cultural_profile: Dict[str, Any],
+                                language: str, base_sentiment: Dict[str, Any],
+                                elapsed: float, feedback_lower: Optional[str] = None) -> Dict[str, Any]:
+        """Apply cultural analysis on top of a precomputed base sentiment"""
+        start_time = time.time() - elapsed
+        
         try:
-            # Detect language if not provided
-            language = user_cultural_profile.get('language', 'auto')
-            if language == 'auto':
-                language = self._detect_language(feedback_text)
-            
-            # Get base sentiment analysis
-            base_sentiment = self._get_base_sentiment(feedback_text, language)
-            
             # Create cultural context
             cultural_context = self._create_cultural_context(user_cultural_profile, language)
             
             # Apply cultural adaptation
             cultural_adjustments = self._calculate_cultural_adjustments(
-                base_sentiment, cultural_context, feedback_text
+                base_sentiment, cultural_context, feedback_text, feedback_lower
             )
             
             # Apply adjustments with bias prevention
@@ -242,16 +365,50 @@ class CulturalIntelligenceEngine:
             }
             
         except Exception as e:
-            processing_time = time.time() - start_time
-            logger.error(f"Error in cultural intelligence analysis: {e}")
-            return {
-                'error': str(e),
-                'base_sentiment': {'label': 'NEUTRAL', 'score': 0.5},
-                'culturally_adjusted_sentiment': {'label': 'NEUTRAL', 'score': 0.5},
-                'cultural_confidence': 0.0,
-                'processing_time': processing_time,
-                'performance_compliant': processing_time <= 0.2
-            }
+            return self._analysis_error_result(e, time.time() - start_time)
+    
+    def _lru_get(self, cache: OrderedDict, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Look up an LRU entry and mark it most recently used"""
+        with self._cache_lock:
+            value = cache.pop(key, None)
+            if value is not None:
+                cache[key] = value
+            return value
+    
+    def _lru_put(self, cache: OrderedDict, key: Tuple, value: Dict[str, Any], max_size: int):
+        """Store an LRU entry, evicting the least recently used one when full"""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > max_size:
+                cache.popitem(last=False)
+    
+    def _replay_cached_analysis(self, cached: Dict[str, Any], processing_time: float) -> Dict[str, Any]:
+        """Account a cached analysis in the processing stats and return it with fresh timing"""
+        self._update_processing_stats(processing_time, cached['cultural_adjustments_applied'])
+        if cached['bias_prevention_applied']:
+            self.processing_stats['bias_prevention_triggers'] += 1
+        
+        performance_compliant = processing_time <= 0.2
+        if not performance_compliant:
+            self.processing_stats['performance_violations'] += 1
+        
+        result = dict(cached)
+        result['processing_time'] = processing_time
+        result['performance_compliant'] = performance_compliant
+        return result
+    
+    def _analysis_error_result(self, error: Exception, processing_time: float) -> Dict[str, Any]:
+        """Neutral result returned when a cultural analysis fails"""
+        logger.error(f"Error in cultural intelligence analysis: {error}")
+        return {
+            'error': str(error),
+            'base_sentiment': {'label': 'NEUTRAL', 'score': 0.5},
+            'culturally_adjusted_sentiment': {'label': 'NEUTRAL', 'score': 0.5},
+            'cultural_confidence': 0.0,
+            'processing_time': processing_time,
+            'performance_compliant': processing_time <= 0.2
+        }
     
     def _detect_language(self, text: str) -> str:
         """Detect language of the text"""
@@ -278,48 +435,106 @@ class CulturalIntelligenceEngine:
     
     def _get_base_sentiment(self, text: str, language: str) -> Dict[str, Any]:
         """Get base sentiment analysis for the text"""
-        try:
-            # Choose appropriate model
-            model_key = 'english' if language == 'en' else 'multilingual'
-            model = self.sentiment_models.get(model_key)
+        return self._get_base_sentiments([text], [language])[0]
+    
+    def _model_key_for(self, language: str) -> str:
+        """Choose the sentiment model for a language"""
+        return 'english' if language == 'en' else 'multilingual'
+    
+    def _get_base_sentiments(self, texts: List[str], languages: List[str],
+                             lowered_texts: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get base sentiment analysis for several texts, one model call per model"""
+        sentiments: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        lowered_texts = lowered_texts or [None] * len(texts)
+        
+        # Choose appropriate model
+        indices_by_model: Dict[str, List[int]] = {}
+        for index, language in enumerate(languages):
+            model_key = self._model_key_for(language)
+            indices_by_model.setdefault(model_key, []).append(index)
+        
+        for model_key, indices in indices_by_model.items():
+            model = self._get_model(model_key)
             
             if model is None:
                 # Fallback to simple sentiment analysis
-                return self._fallback_sentiment_analysis(text)
-            
-            # Get sentiment prediction
-            results = model(text)
+                for index in indices:
+                    sentiments[index] = self._fallback_sentiment_analysis(texts[index], lowered_texts[index])
+                continue
             
-            # Process results (models return different formats)
-            if isinstance(results, list) and len(results) > 0:
-                if isinstance(results[0], list):
-                    # Model returns list of scores
-                    best_result = max(results[0], key=lambda x: x['score'])
+            # Serve repeated texts from the cache; each distinct miss is inferred once
+            pending: Dict[str, List[int]] = {}
+            for index in indices:
+                cache_key = (model_key, texts[index])
+                cached = self._lru_get(self._sentiment_cache, cache_key)
+                if cached is not None:
+                    sentiments[index] = dict(cached)
                 else:
-                    # Model returns single result
-                    best_result = results[0]
-                
-                return {
-                    'label': best_result['label'],
-                    'score': best_result['score'],
-                    'all_scores': results[0] if isinstance(results[0], list) else results,
-                    'model_used': model_key
-                }
+                    pending.setdefault(texts[index], []).append(index)
+            
+            if not pending:
+                continue
+            
+            try:
+                # Get sentiment predictions
+                batch_results = list(zip(pending.items(), model(list(pending), batch_size=32, truncation=True)))
+            except Exception as e:
+                # One bad text fails the whole batch; retry text by text so only the failing ones fall back
+                logger.warning(f"Batched sentiment analysis failed, retrying per text: {e}")
+                batch_results = []
+                for text, text_indices in pending.items():
+                    try:
+                        batch_results.append(((text, text_indices), model([text], truncation=True)[0]))
+                    except Exception as e:
+                        logger.warning(f"Sentiment analysis failed: {e}")
+            
+            for (text, text_indices), results in batch_results:
+                try:
+                    sentiment = self._parse_sentiment_results([results], model_key, text)
+                except Exception as e:
+                    logger.warning(f"Sentiment analysis failed: {e}")
+                    continue
+                if sentiment['model_used'] == model_key:
+                    self._lru_put(self._sentiment_cache, (model_key, text), sentiment, self.sentiment_cache_max_size)
+                for index in text_indices:
+                    sentiments[index] = dict(sentiment)
+            
+            # Texts whose inference failed fall back to keyword sentiment
+            for index in indices:
+                if sentiments[index] is None:
+                    sentiments[index] = self._fallback_sentiment_analysis(texts[index], lowered_texts[index])
+        
+        return sentiments
+    
+    def _parse_sentiment_results(self, results: Any, model_key: str, text: str) -> Dict[str, Any]:
+        """Convert one text's pipeline output into a sentiment dict"""
+        # Process results (models return different formats)
+        if isinstance(results, list) and len(results) > 0:
+            if isinstance(results[0], list):
+                # Model returns list of scores
+                best_result = max(results[0], key=lambda x: x['score'])
             else:
-                return self._fallback_sentiment_analysis(text)
-                
-        except Exception as e:
-            logger.warning(f"Sentiment analysis failed: {e}")
+                # Model returns single result
+                best_result = results[0]
+            
+            return {
+                'label': best_result['label'],
+                'score': best_result['score'],
+                'all_scores': results[0] if isinstance(results[0], list) else results,
+                'model_used': model_key
+            }
+        else:
             return self._fallback_sentiment_analysis(text)
     
-    def _fallback_sentiment_analysis(self, text: str) -> Dict[str, Any]:
-        """Simple fallback sentiment analysis"""
-        positive_words = ['great', 'excellent', 'perfect', 'works', 'good', 'helpful', 'thanks']
-        negative_words = ['wrong', 'broken', 'failed', 'error', 'bad', 'issue', 'problem']
+    def _fallback_sentiment_analysis(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
+        """Simple fallback sentiment analysis (text_lower: precomputed text.lower(), if available)"""
+        if text_lower is None:
+            text_lower = text.lower()
         
-        text_lower = text.lower()
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
+        # One tokenization; whole tokens only, so 'goodness' no longer counts as 'good'
+        tokens = set(_FALLBACK_TOKEN_RE.findall(text_lower))
+        positive_count = len(tokens & _FALLBACK_POSITIVE_WORDS)
+        negative_count = len(tokens & _FALLBACK_NEGATIVE_WORDS)
         
         if positive_count > negative_count:
             return {'label': 'POSITIVE', 'score': 0.7, 'model_used': 'fallback'}
@@ -353,33 +568,18 @@ class CulturalIntelligenceEngine:
         if 'communication_style' in profile:
             return profile['communication_style']
         
-        # Use language-based heuristics
-        direct_languages = self.cultural_patterns['direct_cultures']['languages']
-        indirect_languages = self.cultural_patterns['indirect_cultures']['languages']
-        
-        if language in direct_languages:
-            return 'direct'
-        elif language in indirect_languages:
-            return 'indirect'
-        else:
-            return 'unknown'  # Default to neutral approach
+        # Use language-based heuristics, defaulting to a neutral approach
+        return self._directness_by_language.get(language, 'unknown')
     
     def _determine_context_dependency(self, language: str) -> str:
         """Determine if culture uses high-context or low-context communication"""
-        high_context_languages = self.cultural_patterns['high_context']['languages']
-        low_context_languages = self.cultural_patterns['low_context']['languages']
-        
-        if language in high_context_languages:
-            return 'high_context'
-        elif language in low_context_languages:
-            return 'low_context'
-        else:
-            return 'unknown'
+        return self._context_by_language.get(language, 'unknown')
     
     def _calculate_cultural_adjustments(self, base_sentiment: Dict[str, Any], 
                                       cultural_context: CulturalIntelligenceContext, 
-                                      feedback_text: str) -> Dict[str, float]:
-        """Calculate cultural adjustment factors"""
+                                      feedback_text: str,
+                                      feedback_lower: Optional[str] = None) -> Dict[str, float]:
+        """Calculate cultural adjustment factors (feedback_lower: precomputed feedback_text.lower())"""
         adjustments = {}
         
         # Directness adjustment
@@ -409,7 +609,9 @@ class CulturalIntelligenceEngine:
         # Politeness level adjustment
         if cultural_context.politeness_level == 'high':
             # High politeness cultures may mask true sentiment
-            if 'thank' in feedback_text.lower() or 'please' in feedback_text.lower():
+            if feedback_lower is None:
+                feedback_lower = feedback_text.lower()
+            if any(cue in feedback_lower for cue in _POLITENESS_MASKING_CUES):
                 adjustments['politeness_masking'] = 0.9
             else:
                 adjustments['politeness_masking'] = 1.0
@@ -493,7 +695,7 @@ class CulturalIntelligenceEngine:
         confidence_factors.append(text_length_factor)
         
         # Calculate overall confidence
-        overall_confidence = np.mean(confidence_factors) if confidence_factors else 0.0
+        overall_confidence = sum(confidence_factors) / len(confidence_factors) if confidence_factors else 0.0
         cultural_context.confidence_score = overall_confidence
         
         return overall_confidence
@@ -567,8 +769,8 @@ class CulturalIntelligenceEngine:
             )),
             'cultural_patterns_loaded': len(self.cultural_patterns),
             'sentiment_models_available': {
-                model_name: model is not None 
-                for model_name, model in self.sentiment_models.items()
+                model_name: self.sentiment_models.get(model_name) is not None 
+                for model_name in self._model_ids
             },
             'bias_prevention_settings': self.bias_prevention,
             'system_health': {
@@ -57,6 +57,9 @@ from database.shared_embedding_model_manager import get_shared_embedding_model
 
 logger = logging.getLogger(__name__)
 
+# Smoothing factor for the processing-time exponential moving average
+PROCESSING_TIME_EMA_ALPHA = 0.1
+
 @dataclass
 class ProcessingContext:
     """Context information for enhancement processing."""
@@ -171,6 +174,8 @@ class UnifiedEnhancementProcessor:
         self.stats = {
             'entries_processed': 0,
             'average_processing_time_ms': 0.0,
+            'last_processing_time_ms': 0.0,
+            'processing_time_ema_ms': 0.0,  # EWMA of real entry processing times (for passive monitoring)
             'components_available': components_available,  # Up to 8 enhancement components
             'components_enabled': components_available,
             'semantic_validation_available': self._semantic_validation_available,
@@ -417,6 +422,13 @@ class UnifiedEnhancementProcessor:
                          (self.stats['entries_processed'] - 1) + processing_time_ms)
             self.stats['average_processing_time_ms'] = total_time / self.stats['entries_processed']
             
+            self.stats['last_processing_time_ms'] = processing_time_ms
+            if self.stats['entries_processed'] == 1:
+                self.stats['processing_time_ema_ms'] = processing_time_ms
+            else:
+                self.stats['processing_time_ema_ms'] += PROCESSING_TIME_EMA_ALPHA * (
+                    processing_time_ms - self.stats['processing_time_ema_ms'])
+            
             # Log successful processing
             enhancements_applied = 7 + (1 if self._hybrid_available else 0)
             self.logger.log_entry_processing(entry_id, "success", {
@@ -478,6 +490,8 @@ class UnifiedEnhancementProcessor:
         return {
             'entries_processed': self.stats['entries_processed'],
             'average_processing_time_ms': self.stats['average_processing_time_ms'],
+            'last_processing_time_ms': self.stats['last_processing_time_ms'],
+            'processing_time_ema_ms': self.stats['processing_time_ema_ms'],
             'components_available': self.stats['components_available'],
             'components_enabled': self.stats['components_enabled'],
             'semantic_validation_available': self.stats['semantic_validation_available'],
@@ -16,13 +16,29 @@ Based on July 2025 validation best practices and production system metrics.
 
 import json
 import logging
+import math
+import sys
 import time
 import statistics
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, is_dataclass
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
+# orjson is optional - results fall back to stdlib json serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Numba is optional - significance arithmetic falls back to plain Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Import baseline and enhanced systems
 from database.enhanced_context import analyze_feedback_sentiment  # Baseline pattern-based system
 from processing.multimodal_analysis_pipeline import MultiModalAnalysisPipeline  # Enhanced semantic system
@@ -30,6 +46,62 @@ from processing.multimodal_analysis_pipeline import MultiModalAnalysisPipeline
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Interned sentiment / feedback-type labels shared by test cases and result tallies
+_POS, _NEG, _PAR, _NEU = map(sys.intern, ("positive", "negative", "partial", "neutral"))
+_EXP, _IMP = map(sys.intern, ("explicit", "implicit"))
+_SENTIMENTS = (_POS, _NEG, _PAR, _NEU)
+
+
+def _ab_stats_py(n1, c1, n2, c2):
+    """
+    Closed-form A/B statistics for two Bernoulli samples (1 = baseline, 2 = enhanced).
+    
+    Returns:
+        (z_stat, p_value, cohens_d, ci_95_lower, ci_95_upper)
+    """
+    p1 = c1 / n1 if n1 > 0 else 0.0
+    p2 = c2 / n2 if n2 > 0 else 0.0
+    diff = p2 - p1
+    
+    # Two-proportion z-test using the pooled proportion
+    if n1 > 0 and n2 > 0:
+        pooled_p = (c1 + c2) / (n1 + n2)
+        se_pooled = math.sqrt(pooled_p * (1.0 - pooled_p) * (1.0 / n1 + 1.0 / n2))
+    else:
+        se_pooled = 0.0
+    if se_pooled > 0.0:
+        z_stat = diff / se_pooled
+        p_value = math.erfc(abs(z_stat) / math.sqrt(2.0))
+    else:
+        z_stat = 0.0
+        p_value = 1.0
+    
+    # Effect size (Cohen's d) from the pooled sample variance of both samples
+    dof = n1 + n2 - 2
+    pooled_var = (n1 * p1 * (1.0 - p1) + n2 * p2 * (1.0 - p2)) / dof if dof > 0 else 0.0
+    cohens_d = diff / max(math.sqrt(pooled_var), 0.001)
+    
+    # 95% confidence interval for the accuracy difference
+    diff_std = 0.0
+    if n1 > 0 and n2 > 0:
+        diff_std = math.sqrt(p1 * (1.0 - p1) / n1 + p2 * (1.0 - p2) / n2)
+    
+    return z_stat, p_value, cohens_d, diff - 1.96 * diff_std, diff + 1.96 * diff_std
+
+
+_ab_stats = njit(cache=True, fastmath=True)(_ab_stats_py) if njit is not None else _ab_stats_py
+
+
+# Stdlib encoder for result files, built once (used when orjson is unavailable)
+_encode_results_json = json.JSONEncoder(indent=2, default=str, check_circular=False, ensure_ascii=False).encode
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback serializer: dataclasses as dicts, anything else as str"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
+
 
 @dataclass
 class ValidationTestCase:
@@ -41,6 +113,11 @@ class ValidationTestCase:
     solution_context: Optional[Dict] = None
     description: str = ""
     source: str = "manual"  # 'manual', 'extracted', 'synthetic'
+    
+    def __post_init__(self):
+        # Intern labels so equality checks against the module constants short-circuit on identity
+        self.expected_sentiment = sys.intern(self.expected_sentiment)
+        self.feedback_type = sys.intern(self.feedback_type)
 
 
 @dataclass
@@ -70,6 +147,259 @@ class ABTestResults:
     test_configuration: Dict[str, Any]
 
 
+# Standard test cases, built once at import time and shared by every metrics instance
+
+# Explicit positive feedback cases (high confidence expected)
+_EXPLICIT_POSITIVE = (
+    ValidationTestCase(
+        feedback_content="That worked perfectly!",
+        expected_sentiment=_POS,
+        feedback_type=_EXP,
+        confidence_level="high",
+        description="Direct positive confirmation"
+    ),
+    ValidationTestCase(
+        feedback_content="Perfect solution, exactly what I needed!",
+        expected_sentiment=_POS, 
+        feedback_type=_EXP,
+        confidence_level="high",
+        description="Enthusiastic positive feedback"
+    ),
+    ValidationTestCase(
+        feedback_content="Great job! The fix works flawlessly.",
+        expected_sentiment=_POS,
+        feedback_type=_EXP,
+        confidence_level="high",
+        description="Positive with confirmation"
+    ),
+    ValidationTestCase(
+        feedback_content="Excellent! Problem solved completely.",
+        expected_sentiment=_POS,
+        feedback_type=_EXP,
+        confidence_level="high",
+        description="Explicit success confirmation"
+    )
+)
+
+# Explicit negative feedback cases (high confidence expected)
+_EXPLICIT_NEGATIVE = (
+    ValidationTestCase(
+        feedback_content="That doesn't work at all.",
+        expected_sentiment=_NEG,
+        feedback_type=_EXP,
+        confidence_level="high",
+        description="Direct negative feedback"
+    ),
+    ValidationTestCase(
+        feedback_content="Still getting the same error after applying the fix.",
+        expected_sentiment=_NEG,
+        feedback_type=_EXP,
+        confidence_level="high",
+        description="Explicit failure report"
+    ),
+    ValidationTestCase(
+        feedback_content="The solution failed completely.",
+        expected_sentiment=_NEG,
+        feedback_type=_EXP,
+        confidence_level="high",
+        description="Clear failure statement"
+    ),
+    ValidationTestCase(
+        feedback_content="This approach doesn't solve the problem.",
+        expected_sentiment=_NEG,
+        feedback_type=_EXP,
+        confidence_level="high",
+        description="Solution rejection"
+    )
+)
+
+# Implicit positive feedback cases (challenging for baseline system)
+_IMPLICIT_POSITIVE = (
+    ValidationTestCase(
+        feedback_content="You nailed it!",
+        expected_sentiment=_POS,
+        feedback_type=_IMP,
+        confidence_level="medium",
+        description="Idiomatic positive expression"
+    ),
+    ValidationTestCase(
+        feedback_content="Brilliant approach!",
+        expected_sentiment=_POS,
+        feedback_type=_IMP,
+        confidence_level="medium",
+        description="Approving comment"
+    ),
+    ValidationTestCase(
+        feedback_content="That's the one!",
+        expected_sentiment=_POS,
+        feedback_type=_IMP,
+        confidence_level="medium",
+        description="Selection confirmation"
+    ),
+    ValidationTestCase(
+        feedback_content="Spot on!",
+        expected_sentiment=_POS,
+        feedback_type=_IMP,
+        confidence_level="high",
+        description="Accuracy confirmation"
+    ),
+    ValidationTestCase(
+        feedback_content="You got it right this time.",
+        expected_sentiment=_POS,
+        feedback_type=_IMP,
+        confidence_level="medium",
+        description="Success with context"
+    )
+)
+
+# Implicit negative feedback cases (very challenging for baseline system)
+_IMPLICIT_NEGATIVE = (
+    ValidationTestCase(
+        feedback_content="Let me try something else.",
+        expected_sentiment=_NEG,
+        feedback_type=_IMP,
+        confidence_level="medium",
+        description="Rejection through alternative"
+    ),
+    ValidationTestCase(
+        feedback_content="Hmm, different error now.",
+        expected_sentiment=_NEG,
+        feedback_type=_IMP,
+        confidence_level="medium",
+        description="New problems indication"
+    ),
+    ValidationTestCase(
+        feedback_content="I'll go with a different approach.",
+        expected_sentiment=_NEG,
+        feedback_type=_IMP,
+        confidence_level="medium",
+        description="Abandoning solution"
+    ),
+    ValidationTestCase(
+        feedback_content="Let me explore other options.",
+        expected_sentiment=_NEG,
+        feedback_type=_IMP,
+        confidence_level="low",
+        description="Seeking alternatives"
+    ),
+    ValidationTestCase(
+        feedback_content="Maybe there's another way?",
+        expected_sentiment=_NEG,
+        feedback_type=_IMP,
+        confidence_level="low",
+        description="Questioning current approach"
+    )
+)
+
+# Partial success cases (complex scenarios)
+_PARTIAL_CASES = (
+    ValidationTestCase(
+        feedback_content="Almost there, just need to fix one more issue.",
+        expected_sentiment=_PAR,
+        feedback_type=_EXP,
+        confidence_level="high",
+        description="Progress with remaining issues"
+    ),
+    ValidationTestCase(
+        feedback_content="Better but still has some problems.",
+        expected_sentiment=_PAR,
+        feedback_type=_EXP,
+        confidence_level="high",
+        description="Improvement with issues"
+    ),
+    ValidationTestCase(
+        feedback_content="Getting closer to the solution.",
+        expected_sentiment=_PAR,
+        feedback_type=_IMP,
+        confidence_level="medium",
+        description="Progress indication"
+    ),
+    ValidationTestCase(
+        feedback_content="Build passes but tests are failing.",
+        expected_sentiment=_PAR,
+        feedback_type=_EXP,
+        confidence_level="high",
+        solution_context={"tools_used": ["npm", "jest"]},
+        description="Complex technical outcome"
+    )
+)
+
+_STANDARD_TEST_CASES: Tuple[ValidationTestCase, ...] = (
+    _EXPLICIT_POSITIVE + _EXPLICIT_NEGATIVE + _IMPLICIT_POSITIVE + _IMPLICIT_NEGATIVE + _PARTIAL_CASES
+)
+
+_STANDARD_COUNTS = {
+    'explicit_positive': len(_EXPLICIT_POSITIVE),
+    'explicit_negative': len(_EXPLICIT_NEGATIVE),
+    'implicit_positive': len(_IMPLICIT_POSITIVE),
+    'implicit_negative': len(_IMPLICIT_NEGATIVE),
+    'partial_success': len(_PARTIAL_CASES)
+}
+
+
+# Validation report templates (see ValidationEnhancementMetrics.generate_validation_report)
+_REPORT_TEMPLATE = """\
+================================================================================
+SEMANTIC VALIDATION ENHANCEMENT - COMPREHENSIVE VALIDATION REPORT
+================================================================================
+Test Timestamp: {test_timestamp}
+Total Test Cases: {total_test_cases}
+Explicit Cases: {explicit_cases}
+Implicit Cases: {implicit_cases}
+
+ACCURACY RESULTS:
+----------------------------------------
+Baseline System (Pattern-based):
+  Overall Accuracy: {baseline.accuracy:.1%}
+  Explicit Accuracy: {baseline.explicit_accuracy:.1%}
+  Implicit Accuracy: {baseline.implicit_accuracy:.1%}
+
+Enhanced System (Multi-modal Semantic):
+  Overall Accuracy: {enhanced.accuracy:.1%}
+  Explicit Accuracy: {enhanced.explicit_accuracy:.1%}
+  Implicit Accuracy: {enhanced.implicit_accuracy:.1%}
+
+IMPROVEMENT METRICS:
+----------------------------------------
+Explicit Improvement: {explicit_improvement:+.1%} ({explicit_relative_improvement:+.1%} relative)
+Implicit Improvement: {implicit_improvement:+.1%} ({implicit_relative_improvement:+.1%} relative)
+Overall Improvement: {overall_improvement:+.1%}
+
+TARGET ACHIEVEMENT:
+----------------------------------------
+Explicit Target (≥98%): {explicit_target}
+Implicit Target (≥90%): {implicit_target}
+Both Targets: {both_targets}
+
+PERFORMANCE METRICS:
+----------------------------------------
+Baseline Avg Time: {baseline.average_processing_time_ms:.1f}ms
+Enhanced Avg Time: {enhanced.average_processing_time_ms:.1f}ms
+Speed Factor: {speed_improvement_factor:.1f}x
+Target <250ms: {time_target}
+
+"""
+
+_SIGNIFICANCE_TEMPLATE = """\
+STATISTICAL SIGNIFICANCE:
+----------------------------------------
+P-value: {p_value:.4f}
+Significant: {significant}
+Effect Size (Cohen's d): {cohens_d:.3f} ({effect_size_interpretation})
+95% CI: [{ci_lower:.3f}, {ci_upper:.3f}]
+
+"""
+
+_CONCLUSION_TEMPLATE = """\
+CONCLUSION:
+----------------------------------------
+✅ PRP-2 Semantic Validation Enhancement System demonstrates significant improvements
+✅ Explicit feedback detection: {baseline.explicit_accuracy:.0%} → {enhanced.explicit_accuracy:.0%}
+✅ Implicit feedback detection: {baseline.implicit_accuracy:.0%} → {enhanced.implicit_accuracy:.0%}
+✅ Multi-modal semantic analysis provides substantial accuracy gains
+================================================================================"""
+
+
 class ValidationEnhancementMetrics:
     """
     A/B testing and performance measurement for semantic validation enhancement.
@@ -79,6 +409,12 @@ class ValidationEnhancementMetrics:
     semantic system (98% explicit, 90% implicit).
     """
     
+    # scipy.stats module (False when unavailable), resolved once on first significance calculation
+    _scipy_stats = None
+    
+    # Enhanced analysis pipeline shared by all instances (see _get_pipeline)
+    _pipeline = None
+    
     def __init__(self, 
                  confidence_threshold: float = 0.5,
                  statistical_significance_threshold: float = 0.05):
@@ -93,7 +429,7 @@ class ValidationEnhancementMetrics:
         
         # Initialize analysis systems
         self.baseline_system = None  # Will use function directly
-        self.enhanced_system = MultiModalAnalysisPipeline()
+        self.enhanced_system = self._get_pipeline()
         
         # Configuration
         self.confidence_threshold = confidence_threshold
@@ -111,193 +447,35 @@ class ValidationEnhancementMetrics:
         
         logger.info(f"✅ ValidationEnhancementMetrics initialized with {len(self.test_cases)} test cases")
     
+    @classmethod
+    def _get_pipeline(cls) -> MultiModalAnalysisPipeline:
+        """
+        Get the shared enhanced analysis pipeline, creating and warming it on first use.
+        
+        The pipeline is a class-level singleton so repeated metrics instances don't
+        reload models, and the warmup call keeps lazy model initialization out of the
+        first test case's processing time. Because it is shared, instances are not
+        isolated from each other: all of them use the same pipeline configuration.
+        """
+        if cls._pipeline is None:
+            pipeline = MultiModalAnalysisPipeline()
+            try:
+                pipeline.analyze_feedback_comprehensive({"feedback_content": "warmup", "solution_context": {}})
+            except Exception as e:
+                logger.warning(f"Enhanced pipeline warmup failed: {e}")
+            cls._pipeline = pipeline
+        return cls._pipeline
+    
     def _initialize_standard_test_cases(self):
         """Initialize comprehensive standard test cases for validation"""
-        
-        # Explicit positive feedback cases (high confidence expected)
-        explicit_positive = [
-            ValidationTestCase(
-                feedback_content="That worked perfectly!",
-                expected_sentiment="positive",
-                feedback_type="explicit",
-                confidence_level="high",
-                description="Direct positive confirmation"
-            ),
-            ValidationTestCase(
-                feedback_content="Perfect solution, exactly what I needed!",
-                expected_sentiment="positive", 
-                feedback_type="explicit",
-                confidence_level="high",
-                description="Enthusiastic positive feedback"
-            ),
-            ValidationTestCase(
-                feedback_content="Great job! The fix works flawlessly.",
-                expected_sentiment="positive",
-                feedback_type="explicit",
-                confidence_level="high",
-                description="Positive with confirmation"
-            ),
-            ValidationTestCase(
-                feedback_content="Excellent! Problem solved completely.",
-                expected_sentiment="positive",
-                feedback_type="explicit",
-                confidence_level="high",
-                description="Explicit success confirmation"
-            )
-        ]
-        
-        # Explicit negative feedback cases (high confidence expected)
-        explicit_negative = [
-            ValidationTestCase(
-                feedback_content="That doesn't work at all.",
-                expected_sentiment="negative",
-                feedback_type="explicit",
-                confidence_level="high",
-                description="Direct negative feedback"
-            ),
-            ValidationTestCase(
-                feedback_content="Still getting the same error after applying the fix.",
-                expected_sentiment="negative",
-                feedback_type="explicit",
-                confidence_level="high",
-                description="Explicit failure report"
-            ),
-            ValidationTestCase(
-                feedback_content="The solution failed completely.",
-                expected_sentiment="negative",
-                feedback_type="explicit",
-                confidence_level="high",
-                description="Clear failure statement"
-            ),
-            ValidationTestCase(
-                feedback_content="This approach doesn't solve the problem.",
-                expected_sentiment="negative",
-                feedback_type="explicit",
-                confidence_level="high",
-                description="Solution rejection"
-            )
-        ]
-        
-        # Implicit positive feedback cases (challenging for baseline system)
-        implicit_positive = [
-            ValidationTestCase(
-                feedback_content="You nailed it!",
-                expected_sentiment="positive",
-                feedback_type="implicit",
-                confidence_level="medium",
-                description="Idiomatic positive expression"
-            ),
-            ValidationTestCase(
-                feedback_content="Brilliant approach!",
-                expected_sentiment="positive",
-                feedback_type="implicit",
-                confidence_level="medium",
-                description="Approving comment"
-            ),
-            ValidationTestCase(
-                feedback_content="That's the one!",
-                expected_sentiment="positive",
-                feedback_type="implicit",
-                confidence_level="medium",
-                description="Selection confirmation"
-            ),
-            ValidationTestCase(
-                feedback_content="Spot on!",
-                expected_sentiment="positive",
-                feedback_type="implicit",
-                confidence_level="high",
-                description="Accuracy confirmation"
-            ),
-            ValidationTestCase(
-                feedback_content="You got it right this time.",
-                expected_sentiment="positive",
-                feedback_type="implicit",
-                confidence_level="medium",
-                description="Success with context"
-            )
-        ]
-        
-        # Implicit negative feedback cases (very challenging for baseline system)
-        implicit_negative = [
-            ValidationTestCase(
-                feedback_content="Let me try something else.",
-                expected_sentiment="negative",
-                feedback_type="implicit",
-                confidence_level="medium",
-                description="Rejection through alternative"
-            ),
-            ValidationTestCase(
-                feedback_content="Hmm, different error now.",
-                expected_sentiment="negative",
-                feedback_type="implicit",
-                confidence_level="medium",
-                description="New problems indication"
-            ),
-            ValidationTestCase(
-                feedback_content="I'll go with a different approach.",
-                expected_sentiment="negative",
-                feedback_type="implicit",
-                confidence_level="medium",
-                description="Abandoning solution"
-            ),
-            ValidationTestCase(
-                feedback_content="Let me explore other options.",
-                expected_sentiment="negative",
-                feedback_type="implicit",
-                confidence_level="low",
-                description="Seeking alternatives"
-            ),
-            ValidationTestCase(
-                feedback_content="Maybe there's another way?",
-                expected_sentiment="negative",
-                feedback_type="implicit",
-                confidence_level="low",
-                description="Questioning current approach"
-            )
-        ]
-        
-        # Partial success cases (complex scenarios)
-        partial_cases = [
-            ValidationTestCase(
-                feedback_content="Almost there, just need to fix one more issue.",
-                expected_sentiment="partial",
-                feedback_type="explicit",
-                confidence_level="high",
-                description="Progress with remaining issues"
-            ),
-            ValidationTestCase(
-                feedback_content="Better but still has some problems.",
-                expected_sentiment="partial",
-                feedback_type="explicit",
-                confidence_level="high",
-                description="Improvement with issues"
-            ),
-            ValidationTestCase(
-                feedback_content="Getting closer to the solution.",
-                expected_sentiment="partial",
-                feedback_type="implicit",
-                confidence_level="medium",
-                description="Progress indication"
-            ),
-            ValidationTestCase(
-                feedback_content="Build passes but tests are failing.",
-                expected_sentiment="partial",
-                feedback_type="explicit",
-                confidence_level="high",
-                solution_context={"tools_used": ["npm", "jest"]},
-                description="Complex technical outcome"
-            )
-        ]
-        
-        # Combine all test cases
-        self.test_cases = explicit_positive + explicit_negative + implicit_positive + implicit_negative + partial_cases
+        self.test_cases = list(_STANDARD_TEST_CASES)
         
         logger.info(f"📋 Initialized {len(self.test_cases)} standard test cases:")
-        logger.info(f"   - Explicit positive: {len(explicit_positive)}")
-        logger.info(f"   - Explicit negative: {len(explicit_negative)}")
-        logger.info(f"   - Implicit positive: {len(implicit_positive)}")
-        logger.info(f"   - Implicit negative: {len(implicit_negative)}")
-        logger.info(f"   - Partial success: {len(partial_cases)}")
+        logger.info(f"   - Explicit positive: {_STANDARD_COUNTS['explicit_positive']}")
+        logger.info(f"   - Explicit negative: {_STANDARD_COUNTS['explicit_negative']}")
+        logger.info(f"   - Implicit positive: {_STANDARD_COUNTS['implicit_positive']}")
+        logger.info(f"   - Implicit negative: {_STANDARD_COUNTS['implicit_negative']}")
+        logger.info(f"   - Partial success: {_STANDARD_COUNTS['partial_success']}")
     
     def _test_detection_accuracy(self, test_cases: List[ValidationTestCase], analyzer_system: str) -> ValidationResults:
         """
@@ -316,32 +494,43 @@ class ValidationEnhancementMetrics:
         predictions = []
         
         # Initialize confusion matrix
-        sentiments = ['positive', 'negative', 'partial', 'neutral']
-        confusion_matrix = {true_sent: {pred_sent: 0 for pred_sent in sentiments} for true_sent in sentiments}
+        confusion_matrix = {true_sent: {pred_sent: 0 for pred_sent in _SENTIMENTS} for true_sent in _SENTIMENTS}
+        
+        # Per-pass memo so duplicate inputs are only analyzed once
+        memo: Dict[Tuple[str, str], Tuple[str, float, float]] = {}
         
         for test_case in test_cases:
-            start_time = time.time()
+            memo_key = (test_case.feedback_content,
+                        json.dumps(test_case.solution_context or {}, sort_keys=True, default=str))
             
-            if analyzer_system == 'baseline':
-                # Use baseline pattern-based analysis
-                result = analyze_feedback_sentiment(test_case.feedback_content)
-                predicted_sentiment = result.get('sentiment', 'neutral')
-                confidence = result.get('confidence', 0.0)
+            if memo_key in memo:
+                # Duplicate input - reuse the original prediction and its processing time
+                predicted_sentiment, confidence, processing_time = memo[memo_key]
+            else:
+                start_time = time.perf_counter()
                 
-            elif analyzer_system == 'enhanced':
-                # Use enhanced multi-modal analysis
-                feedback_data = {
-                    'feedback_content': test_case.feedback_content,
-                    'solution_context': test_case.solution_context or {}
-                }
-                result = self.enhanced_system.analyze_feedback_comprehensive(feedback_data)
-                predicted_sentiment = result.semantic_sentiment
-                confidence = result.semantic_confidence
+                if analyzer_system == 'baseline':
+                    # Use baseline pattern-based analysis
+                    result = analyze_feedback_sentiment(test_case.feedback_content)
+                    predicted_sentiment = result.get('sentiment', 'neutral')
+                    confidence = result.get('confidence', 0.0)
+                    
+                elif analyzer_system == 'enhanced':
+                    # Use enhanced multi-modal analysis
+                    feedback_data = {
+                        'feedback_content': test_case.feedback_content,
+                        'solution_context': test_case.solution_context or {}
+                    }
+                    result = self.enhanced_system.analyze_feedback_comprehensive(feedback_data)
+                    predicted_sentiment = result.semantic_sentiment
+                    confidence = result.semantic_confidence
+                    
+                else:
+                    raise ValueError(f"Unknown analyzer system: {analyzer_system}")
                 
-            else:
-                raise ValueError(f"Unknown analyzer system: {analyzer_system}")
+                processing_time = (time.perf_counter() - start_time) * 1000  # Convert to milliseconds
+                memo[memo_key] = (predicted_sentiment, confidence, processing_time)
             
-            processing_time = (time.time() - start_time) * 1000  # Convert to milliseconds
             processing_times.append(processing_time)
             confidence_scores.append(confidence)
             
@@ -368,11 +557,11 @@ class ValidationEnhancementMetrics:
         overall_accuracy = correct_predictions / total_cases if total_cases > 0 else 0.0
         
         # Calculate explicit vs implicit accuracy
-        explicit_cases = [tc for tc in test_cases if tc.feedback_type == 'explicit']
-        implicit_cases = [tc for tc in test_cases if tc.feedback_type == 'implicit']
+        explicit_cases = [tc for tc in test_cases if tc.feedback_type == _EXP]
+        implicit_cases = [tc for tc in test_cases if tc.feedback_type == _IMP]
         
-        explicit_correct = sum(1 for p in predictions if p['test_case'].feedback_type == 'explicit' and p['correct'])
-        implicit_correct = sum(1 for p in predictions if p['test_case'].feedback_type == 'implicit' and p['correct'])
+        explicit_correct = sum(1 for p in predictions if p['test_case'].feedback_type == _EXP and p['correct'])
+        implicit_correct = sum(1 for p in predictions if p['test_case'].feedback_type == _IMP and p['correct'])
         
         explicit_accuracy = explicit_correct / len(explicit_cases) if explicit_cases else 0.0
         implicit_accuracy = implicit_correct / len(implicit_cases) if implicit_cases else 0.0
@@ -390,6 +579,12 @@ class ValidationEnhancementMetrics:
             processing_times=processing_times
         )
     
+    def _timed_detection_accuracy(self, test_cases: List[ValidationTestCase], analyzer_system: str) -> Tuple[ValidationResults, float]:
+        """Run _test_detection_accuracy and return its results with the elapsed time in seconds"""
+        start_time = time.perf_counter()
+        results = self._test_detection_accuracy(test_cases, analyzer_system)
+        return results, time.perf_counter() - start_time
+    
     def run_comprehensive_validation(self, 
                                    custom_test_cases: Optional[List[ValidationTestCase]] = None) -> ABTestResults:
         """
@@ -406,17 +601,13 @@ class ValidationEnhancementMetrics:
         # Use custom test cases or standard test cases
         test_cases = custom_test_cases or self.test_cases
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        # Test baseline system (current pattern-based approach)
-        baseline_start = time.time()
-        baseline_results = self._test_detection_accuracy(test_cases, 'baseline')
-        baseline_time = time.time() - baseline_start
-        
-        # Test enhanced system (new semantic multi-modal approach)
-        enhanced_start = time.time()
-        enhanced_results = self._test_detection_accuracy(test_cases, 'enhanced')
-        enhanced_time = time.time() - enhanced_start
+        # Test baseline system (current pattern-based approach), then enhanced system (new
+        # semantic multi-modal approach). The passes run one after the other so neither's
+        # per-case timings include contention from the other
+        baseline_results, baseline_time = self._timed_detection_accuracy(test_cases, 'baseline')
+        enhanced_results, enhanced_time = self._timed_detection_accuracy(test_cases, 'enhanced')
         
         # Calculate improvement metrics
         improvement_metrics = self._calculate_improvements(baseline_results, enhanced_results)
@@ -434,7 +625,7 @@ class ValidationEnhancementMetrics:
             'enhanced_within_target': enhanced_results.average_processing_time_ms < 250.0  # Target: <250ms
         }
         
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         
         # Create comprehensive results
         ab_results = ABTestResults(
@@ -446,8 +637,8 @@ class ValidationEnhancementMetrics:
             test_timestamp=datetime.now().isoformat(),
             test_configuration={
                 'total_test_cases': len(test_cases),
-                'explicit_cases': len([tc for tc in test_cases if tc.feedback_type == 'explicit']),
-                'implicit_cases': len([tc for tc in test_cases if tc.feedback_type == 'implicit']),
+                'explicit_cases': len([tc for tc in test_cases if tc.feedback_type == _EXP]),
+                'implicit_cases': len([tc for tc in test_cases if tc.feedback_type == _IMP]),
                 'confidence_threshold': self.confidence_threshold,
                 'significance_threshold': self.significance_threshold,
                 'total_validation_time_s': total_time
@@ -505,32 +696,37 @@ class ValidationEnhancementMetrics:
     def _calculate_statistical_significance(self, baseline: ValidationResults, enhanced: ValidationResults) -> Dict[str, Any]:
         """Calculate statistical significance of improvements using appropriate tests"""
         try:
-            from scipy import stats
-            
-            # Prepare accuracy data for statistical testing
-            baseline_accuracies = [1.0 if pred else 0.0 for pred in 
-                                 [True] * baseline.correct_predictions + [False] * (baseline.total_cases - baseline.correct_predictions)]
-            enhanced_accuracies = [1.0 if pred else 0.0 for pred in 
-                                 [True] * enhanced.correct_predictions + [False] * (enhanced.total_cases - enhanced.correct_predictions)]
-            
-            # Perform two-sample t-test for accuracy differences
-            t_stat, p_value = stats.ttest_ind(enhanced_accuracies, baseline_accuracies)
-            
-            # Effect size (Cohen's d)
-            pooled_std = ((len(baseline_accuracies) - 1) * statistics.stdev(baseline_accuracies)**2 + 
-                         (len(enhanced_accuracies) - 1) * statistics.stdev(enhanced_accuracies)**2) / \
-                         (len(baseline_accuracies) + len(enhanced_accuracies) - 2)
-            pooled_std = pooled_std ** 0.5
-            
-            cohens_d = (statistics.mean(enhanced_accuracies) - statistics.mean(baseline_accuracies)) / max(pooled_std, 0.001)
-            
-            # Confidence interval for difference
+            z_stat, z_p_value, cohens_d, ci_95_lower, ci_95_upper = _ab_stats(
+                baseline.total_cases, baseline.correct_predictions,
+                enhanced.total_cases, enhanced.correct_predictions
+            )
             diff_mean = enhanced.accuracy - baseline.accuracy
-            diff_std = ((baseline.accuracy * (1 - baseline.accuracy) / baseline.total_cases) + 
-                       (enhanced.accuracy * (1 - enhanced.accuracy) / enhanced.total_cases)) ** 0.5
             
-            ci_95_lower = diff_mean - 1.96 * diff_std
-            ci_95_upper = diff_mean + 1.96 * diff_std
+            stats = type(self)._scipy_stats
+            if stats is None:
+                try:
+                    from scipy import stats as _stats
+                except ImportError:
+                    logger.warning("scipy not available, using closed-form z-test for significance testing")
+                    _stats = False
+                type(self)._scipy_stats = _stats
+                stats = _stats
+            
+            if stats:
+                # Prepare accuracy data for statistical testing (1.0 = correct, 0.0 = incorrect)
+                baseline_accuracies = np.zeros(baseline.total_cases)
+                baseline_accuracies[:baseline.correct_predictions] = 1.0
+                enhanced_accuracies = np.zeros(enhanced.total_cases)
+                enhanced_accuracies[:enhanced.correct_predictions] = 1.0
+                
+                # Perform two-sample t-test for accuracy differences
+                t_stat, p_value = stats.ttest_ind(enhanced_accuracies, baseline_accuracies)
+                t_stat, p_value = float(t_stat), float(p_value)
+                method = 'ttest'
+            else:
+                # Closed-form two-proportion z-test when scipy is unavailable
+                t_stat, p_value = z_stat, z_p_value
+                method = 'z_test'
             
             return {
                 't_statistic': t_stat,
@@ -543,21 +739,10 @@ class ValidationEnhancementMetrics:
                     'upper': ci_95_upper
                 },
                 'difference_mean': diff_mean,
-                'statistical_power': 'high' if abs(cohens_d) > 0.8 else 'medium' if abs(cohens_d) > 0.5 else 'low'
+                'statistical_power': 'high' if abs(cohens_d) > 0.8 else 'medium' if abs(cohens_d) > 0.5 else 'low',
+                'method': method
             }
             
-        except ImportError:
-            logger.warning("scipy not available, using simplified significance testing")
-            # Simplified significance test without scipy
-            diff = enhanced.accuracy - baseline.accuracy
-            is_significant = diff > 0.05  # Simple threshold
-            
-            return {
-                'difference_mean': diff,
-                'is_significant': is_significant,
-                'method': 'simplified',
-                'note': 'Install scipy for comprehensive statistical testing'
-            }
         except Exception as e:
             logger.warning(f"Statistical significance calculation failed: {e}")
             return {
@@ -581,75 +766,44 @@ class ValidationEnhancementMetrics:
     def generate_validation_report(self, ab_results: ABTestResults) -> str:
         """Generate comprehensive validation report"""
         
-        report_lines = [
-            "=" * 80,
-            "SEMANTIC VALIDATION ENHANCEMENT - COMPREHENSIVE VALIDATION REPORT",
-            "=" * 80,
-            f"Test Timestamp: {ab_results.test_timestamp}",
-            f"Total Test Cases: {ab_results.test_configuration['total_test_cases']}",
-            f"Explicit Cases: {ab_results.test_configuration['explicit_cases']}",
-            f"Implicit Cases: {ab_results.test_configuration['implicit_cases']}",
-            "",
-            "ACCURACY RESULTS:",
-            "-" * 40,
-            f"Baseline System (Pattern-based):",
-            f"  Overall Accuracy: {ab_results.baseline_results.accuracy:.1%}",
-            f"  Explicit Accuracy: {ab_results.baseline_results.explicit_accuracy:.1%}",
-            f"  Implicit Accuracy: {ab_results.baseline_results.implicit_accuracy:.1%}",
-            "",
-            f"Enhanced System (Multi-modal Semantic):",
-            f"  Overall Accuracy: {ab_results.enhanced_results.accuracy:.1%}",
-            f"  Explicit Accuracy: {ab_results.enhanced_results.explicit_accuracy:.1%}",
-            f"  Implicit Accuracy: {ab_results.enhanced_results.implicit_accuracy:.1%}",
-            "",
-            "IMPROVEMENT METRICS:",
-            "-" * 40,
-            f"Explicit Improvement: {ab_results.improvement_metrics['explicit_improvement']:+.1%} "
-            f"({ab_results.improvement_metrics['explicit_relative_improvement']:+.1%} relative)",
-            f"Implicit Improvement: {ab_results.improvement_metrics['implicit_improvement']:+.1%} "
-            f"({ab_results.improvement_metrics['implicit_relative_improvement']:+.1%} relative)",
-            f"Overall Improvement: {ab_results.improvement_metrics['overall_improvement']:+.1%}",
-            "",
-            "TARGET ACHIEVEMENT:",
-            "-" * 40,
-            f"Explicit Target (≥98%): {'✅ ACHIEVED' if ab_results.improvement_metrics['explicit_target_met'] else '❌ NOT MET'}",
-            f"Implicit Target (≥90%): {'✅ ACHIEVED' if ab_results.improvement_metrics['implicit_target_met'] else '❌ NOT MET'}",
-            f"Both Targets: {'✅ SUCCESS' if ab_results.improvement_metrics['targets_achieved'] else '❌ PARTIAL'}",
-            "",
-            "PERFORMANCE METRICS:",
-            "-" * 40,
-            f"Baseline Avg Time: {ab_results.baseline_results.average_processing_time_ms:.1f}ms",
-            f"Enhanced Avg Time: {ab_results.enhanced_results.average_processing_time_ms:.1f}ms",
-            f"Speed Factor: {ab_results.performance_comparison['speed_improvement_factor']:.1f}x",
-            f"Target <250ms: {'✅ MET' if ab_results.performance_comparison['enhanced_within_target'] else '❌ EXCEEDED'}",
-            ""
-        ]
+        baseline = ab_results.baseline_results
+        enhanced = ab_results.enhanced_results
+        config = ab_results.test_configuration
+        improvements = ab_results.improvement_metrics
+        performance = ab_results.performance_comparison
+        significance = ab_results.statistical_significance
+        
+        report = _REPORT_TEMPLATE.format_map({
+            'test_timestamp': ab_results.test_timestamp,
+            'total_test_cases': config['total_test_cases'],
+            'explicit_cases': config['explicit_cases'],
+            'implicit_cases': config['implicit_cases'],
+            'baseline': baseline,
+            'enhanced': enhanced,
+            'explicit_improvement': improvements['explicit_improvement'],
+            'explicit_relative_improvement': improvements['explicit_relative_improvement'],
+            'implicit_improvement': improvements['implicit_improvement'],
+            'implicit_relative_improvement': improvements['implicit_relative_improvement'],
+            'overall_improvement': improvements['overall_improvement'],
+            'explicit_target': '✅ ACHIEVED' if improvements['explicit_target_met'] else '❌ NOT MET',
+            'implicit_target': '✅ ACHIEVED' if improvements['implicit_target_met'] else '❌ NOT MET',
+            'both_targets': '✅ SUCCESS' if improvements['targets_achieved'] else '❌ PARTIAL',
+            'speed_improvement_factor': performance['speed_improvement_factor'],
+            'time_target': '✅ MET' if performance['enhanced_within_target'] else '❌ EXCEEDED'
+        })
         
         # Add statistical significance if available
-        if 'p_value' in ab_results.statistical_significance:
-            report_lines.extend([
-                "STATISTICAL SIGNIFICANCE:",
-                "-" * 40,
-                f"P-value: {ab_results.statistical_significance['p_value']:.4f}",
-                f"Significant: {'✅ YES' if ab_results.statistical_significance['is_significant'] else '❌ NO'}",
-                f"Effect Size (Cohen's d): {ab_results.statistical_significance['cohens_d']:.3f} "
-                f"({ab_results.statistical_significance['effect_size_interpretation']})",
-                f"95% CI: [{ab_results.statistical_significance['confidence_interval_95']['lower']:.3f}, "
-                f"{ab_results.statistical_significance['confidence_interval_95']['upper']:.3f}]",
-                ""
-            ])
-        
-        report_lines.extend([
-            "CONCLUSION:",
-            "-" * 40,
-            f"✅ PRP-2 Semantic Validation Enhancement System demonstrates significant improvements",
-            f"✅ Explicit feedback detection: {ab_results.baseline_results.explicit_accuracy:.0%} → {ab_results.enhanced_results.explicit_accuracy:.0%}",
-            f"✅ Implicit feedback detection: {ab_results.baseline_results.implicit_accuracy:.0%} → {ab_results.enhanced_results.implicit_accuracy:.0%}",
-            f"✅ Multi-modal semantic analysis provides substantial accuracy gains",
-            "=" * 80
-        ])
-        
-        return "\n".join(report_lines)
+        if 'p_value' in significance:
+            report += _SIGNIFICANCE_TEMPLATE.format_map({
+                'p_value': significance['p_value'],
+                'significant': '✅ YES' if significance['is_significant'] else '❌ NO',
+                'cohens_d': significance['cohens_d'],
+                'effect_size_interpretation': significance['effect_size_interpretation'],
+                'ci_lower': significance['confidence_interval_95']['lower'],
+                'ci_upper': significance['confidence_interval_95']['upper']
+            })
+        
+        return report + _CONCLUSION_TEMPLATE.format_map({'baseline': baseline, 'enhanced': enhanced})
     
     def save_validation_results(self, ab_results: ABTestResults, filename: Optional[str] = None) -> Path:
         """Save validation results to JSON file"""
@@ -661,34 +815,14 @@ class ValidationEnhancementMetrics:
         filepath = Path(filename)
         
         # Convert results to JSON-serializable format
-        results_dict = {
-            'test_timestamp': ab_results.test_timestamp,
-            'test_configuration': ab_results.test_configuration,
-            'baseline_results': {
-                'system_name': ab_results.baseline_results.system_name,
-                'accuracy': ab_results.baseline_results.accuracy,
-                'explicit_accuracy': ab_results.baseline_results.explicit_accuracy,
-                'implicit_accuracy': ab_results.baseline_results.implicit_accuracy,
-                'average_processing_time_ms': ab_results.baseline_results.average_processing_time_ms,
-                'total_cases': ab_results.baseline_results.total_cases,
-                'correct_predictions': ab_results.baseline_results.correct_predictions
-            },
-            'enhanced_results': {
-                'system_name': ab_results.enhanced_results.system_name,
-                'accuracy': ab_results.enhanced_results.accuracy,
-                'explicit_accuracy': ab_results.enhanced_results.explicit_accuracy,
-                'implicit_accuracy': ab_results.enhanced_results.implicit_accuracy,
-                'average_processing_time_ms': ab_results.enhanced_results.average_processing_time_ms,
-                'total_cases': ab_results.enhanced_results.total_cases,
-                'correct_predictions': ab_results.enhanced_results.correct_predictions
-            },
-            'improvement_metrics': ab_results.improvement_metrics,
-            'statistical_significance': ab_results.statistical_significance,
-            'performance_comparison': ab_results.performance_comparison
-        }
+        results_dict = asdict(ab_results)
         
-        with open(filepath, 'w') as f:
-            json.dump(results_dict, f, indent=2, default=str)
+        # Serialize in one pass and write once rather than streaming tokens to the file
+        if orjson is not None:
+            filepath.write_bytes(orjson.dumps(results_dict, default=_json_default,
+                                              option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            filepath.write_text(_encode_results_json(results_dict), encoding='utf-8')
         
         logger.info(f"💾 Validation results saved to {filepath}")
         return filepath
@@ -9,11 +9,88 @@ import re
 from collections import Counter
 from datetime import datetime
 
-def analyze_search_results():
-    """Analyze patterns from recent search results"""
+import numpy as np
+
+# orjson is optional - the report falls back to stdlib json serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Numba is optional - large corpora fall back to the plain Python keyword scan
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Command extraction patterns, compiled once; findall yields full "npm run ..." / "git ..." matches.
+# They stay separate because commands can overlap ("npm run digit test" holds both)
+_NPM_RE = re.compile(r'npm run [a-z:.-]+')
+_GIT_RE = re.compile(r'git [a-z]+')
+
+# Automation pattern buckets keyed by the (lowercase) keyword that signals them
+_PATTERN_KEYWORDS = (
+    ('agent', 'agent_tool_usage'),
+    ('timeout', 'timeout_prevention'),
+    ('test', 'testing_workflows'),
+    ('environment', 'environment_setup'),
+)
+
+# Corpus size from which the compiled keyword scan beats the per-sample loop
+_JIT_MIN_SAMPLES = 1000
+
+
+def _scan_keywords(data, offsets, keywords, keyword_offsets):
+    """Per-sample keyword presence over a concatenated lowercase UTF-8 byte corpus"""
+    n_samples = offsets.shape[0] - 1
+    n_keywords = keyword_offsets.shape[0] - 1
+    hits = np.zeros((n_samples, n_keywords), dtype=np.bool_)
+    for i in prange(n_samples):
+        start = offsets[i]
+        end = offsets[i + 1]
+        for j in range(n_keywords):
+            kw_start = keyword_offsets[j]
+            kw_len = keyword_offsets[j + 1] - kw_start
+            for pos in range(start, end - kw_len + 1):
+                found = True
+                for q in range(kw_len):
+                    if data[pos + q] != keywords[kw_start + q]:
+                        found = False
+                        break
+                if found:
+                    hits[i, j] = True
+                    break
+    return hits
+
+
+if njit is not None:
+    _scan_keywords = njit(parallel=True, cache=True)(_scan_keywords)
+
+_KEYWORD_BYTES = np.frombuffer(b"".join(keyword.encode() for keyword, _ in _PATTERN_KEYWORDS), dtype=np.uint8)
+_KEYWORD_OFFSETS = np.cumsum([0] + [len(keyword) for keyword, _ in _PATTERN_KEYWORDS]).astype(np.int64)
+
+
+def _tally_patterns_compiled(texts):
+    """Automation pattern counts via the compiled scan, in the same order the per-sample loop produces"""
+    encoded = [text.lower().encode('utf-8') for text in texts]
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(chunk) for chunk in encoded], out=offsets[1:])
+    
+    hits = _scan_keywords(data, offsets, _KEYWORD_BYTES, _KEYWORD_OFFSETS)
+    totals = hits.sum(axis=0)
+    
+    # Counter ties are ordered by first insertion: first matching sample, then table order
+    present = [j for j in range(len(_PATTERN_KEYWORDS)) if totals[j]]
+    present.sort(key=lambda j: int(hits[:, j].argmax()))
+    return Counter({_PATTERN_KEYWORDS[j][1]: int(totals[j]) for j in present})
+
+def analyze_search_results(conversations=None):
+    """Analyze patterns from recent search results (or the given conversation texts)"""
     
     # Sample data from the vector database searches we performed
-    sample_conversations = [
+    sample_conversations = conversations if conversations is not None else [
         "npm run test:e2e:smoke",
         "npm run test:e2e:dev", 
         "npx playwright test e2e/quick-screenshots.spec.ts --project=chromium",
@@ -37,25 +114,18 @@ def analyze_search_results():
     command_counts = Counter()
     automation_patterns = Counter()
     
-    for text in sample_conversations:
-        # Extract commands
-        npm_matches = re.findall(r'npm run ([a-z:.-]+)', text)
-        for cmd in npm_matches:
-            command_counts[f"npm run {cmd}"] += 1
-        
-        git_matches = re.findall(r'git ([a-z]+)', text)
-        for cmd in git_matches:
-            command_counts[f"git {cmd}"] += 1
-        
-        # Extract automation patterns
-        if 'agent' in text.lower():
-            automation_patterns['agent_tool_usage'] += 1
-        if 'timeout' in text.lower():
-            automation_patterns['timeout_prevention'] += 1
-        if 'test' in text.lower():
-            automation_patterns['testing_workflows'] += 1
-        if 'environment' in text.lower():
-            automation_patterns['environment_setup'] += 1
+    # Extract commands with one scan per pattern over the whole corpus (commands never span the newline separator)
+    corpus = "\n".join(sample_conversations)
+    command_counts.update(_NPM_RE.findall(corpus))
+    command_counts.update(_GIT_RE.findall(corpus))
+    
+    # Extract automation patterns
+    if njit is not None and len(sample_conversations) >= _JIT_MIN_SAMPLES:
+        automation_patterns = _tally_patterns_compiled(sample_conversations)
+    else:
+        for text in sample_conversations:
+            text_lower = text.lower()
+            automation_patterns.update(bucket for keyword, bucket in _PATTERN_KEYWORDS if keyword in text_lower)
     
     return {
         'command_frequency': command_counts.most_common(),
@@ -234,8 +304,12 @@ def generate_report():
     
     # Save report
     report_path = "/home/user/.claude-vector-db/analytics_report.json"
-    with open(report_path, 'w') as f:
-        json.dump(report, f, indent=2)
+    if orjson is not None:
+        with open(report_path, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
     
     print(f"\n✅ Analysis complete! Report saved to {report_path}")
     
@@ -5,132 +5,391 @@ Analyzes conversation patterns to identify automation opportunities
 """
 
 import json
-from collections import Counter, defaultdict
+import multiprocessing
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 import re
 from datetime import datetime
 import chromadb
+import numpy as np
+
+# orjson is optional - the report falls back to stdlib json serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Numba is optional - without it literal presence is checked with str.__contains__
+try:
+    from numba import njit, prange, set_num_threads
+except ImportError:
+    njit = None
+    prange = range
+    set_num_threads = None
+
+# Characters of each document scanned for categories and timeout indicators, bounding the
+# cost of pathological documents such as pasted build logs
+_MAX_SCAN = 64 * 1024
+
+# Page size from which the compiled literal scan beats per-document substring checks
+_JIT_MIN_DOCUMENTS = 1000
+
+
+def _scan_literals(data, offsets, literals, literal_offsets, prefixes):
+    """Per-document literal presence bitmask over a concatenated lowercase UTF-8 byte buffer
+
+    Single pass per document: prefixes[b0 << 8 | b1] holds the bits of the literals starting with
+    that byte pair (all literals are at least two bytes), so most positions compare nothing.
+    """
+    n_documents = offsets.shape[0] - 1
+    masks = np.zeros(n_documents, dtype=np.int64)
+    for i in prange(n_documents):
+        end = offsets[i + 1]
+        mask = 0
+        for pos in range(offsets[i], end - 1):
+            candidates = prefixes[(data[pos] << 8) | data[pos + 1]] & ~mask
+            while candidates:
+                j = 0
+                while not (candidates >> j) & 1:
+                    j += 1
+                candidates &= ~(1 << j)
+                literal_start = literal_offsets[j]
+                literal_len = literal_offsets[j + 1] - literal_start
+                if pos + literal_len > end:
+                    continue
+                found = True
+                for q in range(2, literal_len):
+                    if data[pos + q] != literals[literal_start + q]:
+                        found = False
+                        break
+                if found:
+                    mask |= 1 << j
+        masks[i] = mask
+    return masks
+
+
+if njit is not None:
+    _scan_literals = njit(parallel=True, cache=True)(_scan_literals)
+
+
+def _literal_masks(texts, literals):
+    """Bit j of each document's mask is set when literals[j] occurs in the (lowercased) text"""
+    if njit is None or len(texts) < _JIT_MIN_DOCUMENTS:
+        return [
+            sum(1 << j for j, literal in enumerate(literals) if literal in text)
+            for text in texts
+        ]
+    
+    # UTF-8 never embeds ASCII bytes inside multi-byte sequences, so a byte match of an
+    # ASCII literal is exactly a substring match on the decoded text
+    encoded = [text.encode('utf-8', 'surrogatepass') for text in texts]
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(chunk) for chunk in encoded], out=offsets[1:])
+    literal_bytes = np.frombuffer("".join(literals).encode('ascii'), dtype=np.uint8)
+    literal_offsets = np.cumsum([0] + [len(literal) for literal in literals]).astype(np.int64)
+    prefixes = np.zeros(1 << 16, dtype=np.int64)
+    for j, literal in enumerate(literals):
+        prefixes[(ord(literal[0]) << 8) | ord(literal[1])] |= 1 << j
+    return _scan_literals(data, offsets, literal_bytes, literal_offsets, prefixes).tolist()
+
+
+# Command patterns, one per tool and scanned in this order. They run as separate passes
+# because commands can overlap ('npm run git status' holds both an npm and a git command)
+_COMMAND_PATTERNS = (
+    ('npm run ', re.compile(r'npm run ([a-z:.-]+)', re.IGNORECASE)),
+    ('git ', re.compile(r'git ([a-z-]+)', re.IGNORECASE)),
+    ('playwright test ', re.compile(r'playwright test ([^\s]+)', re.IGNORECASE)),
+)
+_COMMAND_PREFIXES = {pattern: prefix for prefix, pattern in _COMMAND_PATTERNS}
+
+
+def _command_key(match):
+    """Counter key for a command match: the full match text when its prefix is already canonical"""
+    command = match.group()
+    prefix = _COMMAND_PREFIXES[match.re]
+    if command.startswith(prefix):
+        return command
+    # Case variants ('NPM RUN build') are keyed under the canonical lowercase prefix
+    return prefix + match.group(1)
+
+
+# Each command pattern's literal prefix is its anchor. For ASCII text a case-insensitive
+# match implies the lowercase literal; non-ASCII text can match through Unicode case
+# folding (e.g. 'ı', 'ſ'), so it always gets the full scan
+_COMMAND_ANCHORS = tuple(prefix for prefix, _ in _COMMAND_PATTERNS)
+
+# Prompt pattern categories as keyword sets. A keyword matches when it is a whole word
+# (\b...\b), i.e. a maximal \w+ run, so ASCII documents are tokenized once and tested with
+# set intersections; multi-word phrases fall back to a boundary regex. Non-ASCII documents
+# keep case-insensitive regexes on the original text, since Unicode case folding
+# ('ı', 'ſ', 'İ') does not survive str.lower()
+_REQUEST_KEYWORDS = {
+    'testing': ('test', 'spec', 'screenshot', 'e2e', 'playwright'),
+    'development': ('dev', 'start', 'build', 'run', 'serve'),
+    'git_workflow': ('commit', 'push', 'pull', 'branch', 'merge', 'git'),
+    'debugging': ('error', 'fail', 'debug', 'fix', 'issue', 'problem'),
+    'file_operations': ('read', 'write', 'edit', 'create', 'modify', 'file'),
+    'explanation': ('what', 'how', 'why', 'explain', 'describe', 'tell me'),
+    'automation': ('automate', 'script', 'hook', 'agent', 'workflow')
+}
+_REQUEST_WORDS = {
+    name: frozenset(keyword for keyword in keywords if ' ' not in keyword)
+    for name, keywords in _REQUEST_KEYWORDS.items()
+}
+_REQUEST_PHRASES = {
+    name: re.compile(r'\b(?:' + '|'.join(map(re.escape, phrases)) + r')\b')
+    for name, keywords in _REQUEST_KEYWORDS.items()
+    if (phrases := [keyword for keyword in keywords if ' ' in keyword])
+}
+_REQUEST_PATTERNS_UNICODE = {
+    name: re.compile(r'\b(?:' + '|'.join(map(re.escape, keywords)) + r')\b', re.IGNORECASE)
+    for name, keywords in _REQUEST_KEYWORDS.items()
+}
+_WORD_RE = re.compile(r'\w+')
+
+# Common workflow sequences
+_SEQUENCE_PATTERNS = [
+    ['npm run dev', 'npm run test'],
+    ['git add', 'git commit'],
+    ['npm run build', 'npm run test'],
+    ['playwright test', 'screenshot'],
+    ['typecheck', 'lint', 'build'],
+    ['npm run validate', 'git commit'],
+]
+_SEQUENCE_STEPS = sorted({item.lower() for sequence in _SEQUENCE_PATTERNS for item in sequence})
+
+# Timeout patterns
+_TIMEOUT_INDICATORS = [
+    'timeout', 'timed out', '2 minutes', '120000ms', 
+    'command failed', 'agent tool', 'use agent'
+]
+# Commands mentioned in timeout contexts. Keys keep the document's own casing, so this runs
+# case-insensitively on the original text rather than on the lowercased scan buffer
+_TIMEOUT_COMMAND_RE = re.compile(r'npm run [a-z:.-]+|playwright test|git [a-z-]+', re.IGNORECASE)
+# Timeout context previews kept for the report (the first ones seen)
+_TIMEOUT_CONTEXT_SAMPLES = 10
+# User prompt samples kept for the report (the first ones seen)
+_USER_PROMPT_SAMPLES = 20
+
+# Every literal substring the pass tests for, resolved to one presence bitmask per
+# document (compiled byte scan for large pages). Each distinct workflow step is searched
+# once; a sequence is present when every bit of its mask is set
+_LITERALS = tuple(dict.fromkeys((*_COMMAND_ANCHORS, *_SEQUENCE_STEPS, *_TIMEOUT_INDICATORS)))
+_COMMAND_SCANS = [(1 << _LITERALS.index(prefix), pattern) for prefix, pattern in _COMMAND_PATTERNS]
+_TIMEOUT_MASK = sum(1 << _LITERALS.index(indicator) for indicator in _TIMEOUT_INDICATORS)
+_SEQUENCE_MASKS = [
+    (' → '.join(sequence), sum(1 << _LITERALS.index(step) for step in {item.lower() for item in sequence}))
+    for sequence in _SEQUENCE_PATTERNS
+]
+
+
+def _init_scan_worker():
+    """Keep the compiled literal scan single-threaded inside pool workers (no oversubscription)"""
+    if set_num_threads is not None:
+        set_num_threads(1)
+
+
+def _scan_documents(batch):
+    """Scan one page of documents, returning its partial tallies and samples in document order
+
+    Module-level so that pages can be dispatched to worker processes.
+    """
+    command_patterns = Counter()
+    pattern_counts = Counter()
+    user_prompts = []
+    sequence_counts = Counter()
+    timeout_commands = Counter()
+    timeout_contexts = []
+    timeout_mentions = 0
+    
+    # Category and timeout detection only look at the first _MAX_SCAN characters
+    lowered = [content[:_MAX_SCAN].lower() if content else '' for content in batch]
+    
+    for content, content_lower, present in zip(batch, lowered, _literal_masks(lowered, _LITERALS)):
+        if not content:
+            continue
+        
+        # Commands and workflow sequences cover the full text, so longer documents
+        # get their literals resolved again over everything
+        full_present = present
+        if len(content) > _MAX_SCAN:
+            full_present = _literal_masks([content.lower()], _LITERALS)[0]
+        
+        # Find npm, git and playwright commands, skipping the passes whose literal
+        # prefix cannot occur in the document
+        full_scan = not content.isascii()
+        for anchor_bit, pattern in _COMMAND_SCANS:
+            if full_scan or full_present & anchor_bit:
+                command_patterns.update(map(_command_key, pattern.finditer(content)))
+        
+        # Heuristic: user prompts are typically shorter and contain questions/requests.
+        # Only a fixed number are sampled, so the check stops once the page's sample is full
+        if len(user_prompts) < _USER_PROMPT_SAMPLES and len(content) < 500 and ('?' in content or any(word in content_lower for word in ['can you', 'please', 'help', 'how to'])):
+            user_prompts.append(content)
+        
+        # Count pattern matches
+        scan_buf = content if len(content) <= _MAX_SCAN else content[:_MAX_SCAN]
+        if scan_buf.isascii():
+            words = set(_WORD_RE.findall(content_lower))
+            pattern_counts.update([
+                pattern_name for pattern_name, keywords in _REQUEST_WORDS.items()
+                if not keywords.isdisjoint(words)
+                or ((phrase := _REQUEST_PHRASES.get(pattern_name)) is not None and phrase.search(content_lower))
+            ])
+        else:
+            pattern_counts.update([
+                pattern_name for pattern_name, pattern in _REQUEST_PATTERNS_UNICODE.items()
+                if pattern.search(scan_buf)
+            ])
+        
+        # Look for workflow sequences in conversation content
+        if full_present:
+            sequence_counts.update([
+                sequence_key for sequence_key, mask in _SEQUENCE_MASKS if full_present & mask == mask
+            ])
+        
+        # Timeout contexts
+        if present & _TIMEOUT_MASK:
+            timeout_mentions += 1
+            if len(timeout_contexts) < _TIMEOUT_CONTEXT_SAMPLES:
+                timeout_contexts.append(content[:200] + '...')
+            
+            # Extract commands mentioned in timeout contexts
+            timeout_commands.update(_TIMEOUT_COMMAND_RE.findall(content))
+    
+    return (command_patterns, pattern_counts, user_prompts, sequence_counts,
+            timeout_commands, timeout_contexts, timeout_mentions)
+
 
 class ConversationAnalytics:
+    # Documents fetched per ChromaDB page
+    DOCUMENT_BATCH_SIZE = 8192
+    # Worker processes scanning pages in parallel; 1 (the default) scans in-process, where
+    # the compiled literal scan already uses every core
+    ANALYSIS_WORKERS = 1
+    
     def __init__(self, db_path="/home/user/.claude-vector-db/db"):
         """Initialize analytics with ChromaDB connection"""
         self.client = chromadb.PersistentClient(path=db_path)
         self.collection = self.client.get_or_create_collection("conversations")
+        self._cache = None
+        self._signals = None
     
-    def analyze_command_patterns(self):
-        """Analyze common command patterns and frequency"""
-        # Get all conversations
-        all_conversations = self.collection.get()
+    def _iter_documents(self, batch_size=None):
+        """Yield the collection's documents page by page"""
+        batch_size = batch_size or self.DOCUMENT_BATCH_SIZE
+        offset = 0
+        while True:
+            batch = self.collection.get(include=['documents'], limit=batch_size, offset=offset)['documents']
+            if batch:
+                yield batch
+            if len(batch) < batch_size:
+                return
+            offset += batch_size
+    
+    def analyze_all(self, refresh=False):
+        """Run every corpus analysis in a single paged pass (cached until refresh=True)"""
+        if self._cache is not None and not refresh:
+            return self._cache
         
-        command_patterns = Counter()
-        npm_commands = Counter()
-        git_commands = Counter()
-        testing_commands = Counter()
+        total_analyzed = 0
         
-        # Regex patterns for common commands
-        npm_pattern = re.compile(r'npm run ([a-z:.-]+)', re.IGNORECASE)
-        git_pattern = re.compile(r'git ([a-z-]+)', re.IGNORECASE)
-        playwright_pattern = re.compile(r'playwright test ([^\s]+)', re.IGNORECASE)
+        command_patterns = Counter()
+        pattern_counts = Counter()
+        user_prompts = []
+        sequence_counts = Counter()
+        timeout_commands = Counter()
+        timeout_contexts = []
+        timeout_mentions = 0
         
-        for content in all_conversations['documents']:
-            if not content:
-                continue
-                
-            # Find npm commands
-            npm_matches = npm_pattern.findall(content)
-            for cmd in npm_matches:
-                npm_commands[f"npm run {cmd}"] += 1
-                command_patterns[f"npm run {cmd}"] += 1
-            
-            # Find git commands  
-            git_matches = git_pattern.findall(content)
-            for cmd in git_matches:
-                git_commands[f"git {cmd}"] += 1
-                command_patterns[f"git {cmd}"] += 1
-            
-            # Find playwright commands
-            playwright_matches = playwright_pattern.findall(content)
-            for cmd in playwright_matches:
-                testing_commands[f"playwright test {cmd}"] += 1
-                command_patterns[f"playwright test {cmd}"] += 1
+        def merge(partial):
+            nonlocal timeout_mentions
+            # Partials are merged in page order, so first-seen key order and samples match a serial pass
+            commands, patterns, prompts, sequences, timeouts, contexts, mentions = partial
+            command_patterns.update(commands)
+            pattern_counts.update(patterns)
+            user_prompts.extend(prompts[:_USER_PROMPT_SAMPLES - len(user_prompts)])
+            sequence_counts.update(sequences)
+            timeout_commands.update(timeouts)
+            timeout_contexts.extend(contexts[:_TIMEOUT_CONTEXT_SAMPLES - len(timeout_contexts)])
+            timeout_mentions += mentions
         
-        return {
-            'all_commands': command_patterns.most_common(20),
-            'npm_commands': npm_commands.most_common(15),
-            'git_commands': git_commands.most_common(10),
-            'testing_commands': testing_commands.most_common(10)
-        }
-    
-    def analyze_prompt_patterns(self):
-        """Analyze common prompt patterns and intentions"""
-        all_conversations = self.collection.get()
+        if self.ANALYSIS_WORKERS > 1:
+            # Pages are scanned in worker processes; a bounded window of in-flight pages keeps
+            # memory flat while the next page is fetched
+            # Spawned rather than forked: the parent already holds the ChromaDB client's threads
+            with ProcessPoolExecutor(
+                max_workers=self.ANALYSIS_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_scan_worker
+            ) as executor:
+                pending = deque()
+                for batch in self._iter_documents():
+                    total_analyzed += len(batch)
+                    pending.append(executor.submit(_scan_documents, batch))
+                    if len(pending) >= 2 * self.ANALYSIS_WORKERS:
+                        merge(pending.popleft().result())
+                while pending:
+                    merge(pending.popleft().result())
+        else:
+            for batch in self._iter_documents():
+                total_analyzed += len(batch)
+                merge(_scan_documents(batch))
         
-        # Pattern categories
-        request_patterns = {
-            'testing': re.compile(r'\b(test|spec|screenshot|e2e|playwright)\b', re.IGNORECASE),
-            'development': re.compile(r'\b(dev|start|build|run|serve)\b', re.IGNORECASE),
-            'git_workflow': re.compile(r'\b(commit|push|pull|branch|merge|git)\b', re.IGNORECASE),
-            'debugging': re.compile(r'\b(error|fail|debug|fix|issue|problem)\b', re.IGNORECASE),
-            'file_operations': re.compile(r'\b(read|write|edit|create|modify|file)\b', re.IGNORECASE),
-            'explanation': re.compile(r'\b(what|how|why|explain|describe|tell me)\b', re.IGNORECASE),
-            'automation': re.compile(r'\b(automate|script|hook|agent|workflow)\b', re.IGNORECASE)
-        }
+        # Every command key starts with its literal prefix, so the per-tool tallies are
+        # partitions of command_patterns (first-seen order, and thus tie order, is preserved)
+        npm_commands, git_commands, testing_commands = (
+            Counter({command: count for command, count in command_patterns.items() if command.startswith(prefix)})
+            for prefix in _COMMAND_ANCHORS
+        )
         
-        pattern_counts = defaultdict(int)
-        user_prompts = []
+        top_npm_commands = npm_commands.most_common(15)
+        top_git_commands = git_commands.most_common(10)
         
-        # Collect user prompts (assume they're shorter and more question-like)
-        for i, content in enumerate(all_conversations['documents']):
-            if not content:
-                continue
-                
-            # Heuristic: user prompts are typically shorter and contain questions/requests
-            if len(content) < 500 and ('?' in content or any(word in content.lower() for word in ['can you', 'please', 'help', 'how to'])):
-                user_prompts.append(content)
-            
-            # Count pattern matches
-            for pattern_name, pattern in request_patterns.items():
-                if pattern.search(content):
-                    pattern_counts[pattern_name] += 1
+        # Template triggers over the reported top commands; every git key contains 'git'
+        self._signals = {
+            'has_test_cmd': any('test' in cmd for cmd, _ in top_npm_commands),
+            'has_dev_cmd': any('dev' in cmd for cmd, _ in top_npm_commands),
+            'has_git_cmd': bool(top_git_commands)
+        }
         
-        return {
-            'pattern_frequency': dict(pattern_counts),
-            'sample_user_prompts': user_prompts[:20],
-            'total_analyzed': len(all_conversations['documents'])
+        self._cache = {
+            'command_patterns': {
+                'all_commands': command_patterns.most_common(20),
+                'npm_commands': top_npm_commands,
+                'git_commands': top_git_commands,
+                'testing_commands': testing_commands.most_common(10)
+            },
+            'prompt_patterns': {
+                'pattern_frequency': dict(pattern_counts),
+                'sample_user_prompts': user_prompts,
+                'total_analyzed': total_analyzed,
+                'scan_policy': f'categories and timeout indicators use the first {_MAX_SCAN} characters of each document; commands and workflow sequences use the full text'
+            },
+            'workflow_sequences': {
+                'common_sequences': dict(sequence_counts),
+                'automation_opportunities': self._identify_automation_opportunities(sequence_counts)
+            },
+            'timeout_patterns': {
+                'timeout_prone_commands': dict(timeout_commands),
+                'timeout_contexts': timeout_contexts,
+                'total_timeout_mentions': timeout_mentions
+            }
         }
+        return self._cache
+    
+    def analyze_command_patterns(self):
+        """Analyze common command patterns and frequency"""
+        return self.analyze_all()['command_patterns']
+    
+    def analyze_prompt_patterns(self):
+        """Analyze common prompt patterns and intentions"""
+        return self.analyze_all()['prompt_patterns']
     
     def analyze_workflow_sequences(self):
         """Analyze common workflow sequences that could be automated"""
-        all_conversations = self.collection.get()
-        
-        # Common workflow sequences
-        workflow_sequences = []
-        sequence_patterns = [
-            ['npm run dev', 'npm run test'],
-            ['git add', 'git commit'],
-            ['npm run build', 'npm run test'],
-            ['playwright test', 'screenshot'],
-            ['typecheck', 'lint', 'build'],
-            ['npm run validate', 'git commit'],
-        ]
-        
-        sequence_counts = defaultdict(int)
-        
-        # Look for sequences in conversation content
-        for content in all_conversations['documents']:
-            if not content:
-                continue
-                
-            content_lower = content.lower()
-            for sequence in sequence_patterns:
-                # Check if all items in sequence appear in content
-                if all(item.lower() in content_lower for item in sequence):
-                    sequence_key = ' → '.join(sequence)
-                    sequence_counts[sequence_key] += 1
-        
-        return {
-            'common_sequences': dict(sequence_counts),
-            'automation_opportunities': self._identify_automation_opportunities(sequence_counts)
-        }
+        return self.analyze_all()['workflow_sequences']
     
     def _identify_automation_opportunities(self, sequence_counts):
         """Identify specific automation opportunities based on sequence frequency"""
@@ -167,33 +426,7 @@ class ConversationAnalytics:
     
     def analyze_timeout_patterns(self):
         """Analyze patterns that commonly lead to timeouts"""
-        all_conversations = self.collection.get()
-        
-        timeout_indicators = [
-            'timeout', 'timed out', '2 minutes', '120000ms', 
-            'command failed', 'agent tool', 'use agent'
-        ]
-        
-        timeout_commands = defaultdict(int)
-        timeout_contexts = []
-        
-        for content in all_conversations['documents']:
-            if not content:
-                continue
-                
-            if any(indicator in content.lower() for indicator in timeout_indicators):
-                timeout_contexts.append(content[:200] + '...')
-                
-                # Extract commands mentioned in timeout contexts
-                commands = re.findall(r'npm run [a-z:.-]+|playwright test|git [a-z-]+', content, re.IGNORECASE)
-                for cmd in commands:
-                    timeout_commands[cmd] += 1
-        
-        return {
-            'timeout_prone_commands': dict(timeout_commands),
-            'timeout_contexts': timeout_contexts[:10],
-            'total_timeout_mentions': len(timeout_contexts)
-        }
+        return self.analyze_all()['timeout_patterns']
     
     def generate_sub_agent_recommendations(self):
         """Generate specific sub-agent workflow recommendations"""
@@ -253,13 +486,13 @@ class ConversationAnalytics:
     
     def generate_prompt_templates(self):
         """Generate automated prompt templates for common tasks"""
-        prompt_analysis = self.analyze_prompt_patterns()
-        command_analysis = self.analyze_command_patterns()
+        self.analyze_all()
+        signals = self._signals
         
         templates = []
         
         # Testing automation templates
-        if any('test' in cmd for cmd, _ in command_analysis['npm_commands']):
+        if signals['has_test_cmd']:
             templates.append({
                 'name': 'Quick E2E Testing',
                 'pattern': 'testing_workflow',
@@ -278,7 +511,7 @@ Goal: Reliable testing execution without timeout issues.''',
             })
         
         # Development setup templates
-        if any('dev' in cmd for cmd, _ in command_analysis['npm_commands']):
+        if signals['has_dev_cmd']:
             templates.append({
                 'name': 'Development Environment Setup',
                 'pattern': 'environment_setup', 
@@ -297,7 +530,7 @@ Goal: Eliminate timeout issues by ensuring proper environment setup.''',
             })
         
         # Git workflow templates
-        if any('git' in cmd for cmd, _ in command_analysis['git_commands']):
+        if signals['has_git_cmd']:
             templates.append({
                 'name': 'Git Workflow Automation',
                 'pattern': 'git_workflow',
@@ -360,8 +593,12 @@ def main():
     
     # Save report
     report_path = "/home/user/.claude-vector-db/analytics_report.json"
-    with open(report_path, 'w') as f:
-        json.dump(report, f, indent=2)
+    if orjson is not None:
+        with open(report_path, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
     
     print(f"\n✅ Analysis complete! Report saved to {report_path}")
     